@@ -3,17 +3,36 @@ import sys
 import shutil
 import difflib
 import platform
-import tkinter as tk
-from tkinter import filedialog
 import argparse
 import logging
 import time
 import threading
 import datetime
 import json
+import asyncio
+import re
+import fnmatch
+import hashlib
+import hmac
+import secrets
+import io
+import mmap
+import tempfile
+import contextlib
+import errno
+import tarfile
+import zipfile
+import socket
+import socketserver
+import queue
+import signal
+from array import array
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Tuple, Dict, Any
+from typing import List, Optional, Tuple, Dict, Any, Iterator
 import logging
+import logging.handlers
 import ctypes
 
 
@@ -94,6 +113,375 @@ questionary_style = QuestionaryStyle(
 )
 
 
+# How progress is reported: "rich" (spinners and bars), "plain" (--quiet) or
+# "json" (--json, one JSON object per line on stdout)
+output_mode = "rich"
+_json_lock = threading.Lock()
+
+
+def emit_json(record: Dict[str, Any]):
+    """Write one JSON line to stdout."""
+    with _json_lock:
+        sys.stdout.write(json.dumps(record, default=str) + "\n")
+        sys.stdout.flush()
+
+
+class _SilentSpinner:
+    """Stand-in for a yaspin spinner when spinners are turned off."""
+
+    text = ""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def ok(self, _=None):
+        pass
+
+    def fail(self, _=None):
+        pass
+
+
+def spinner(kind, text: str):
+    """Return a yaspin spinner, or a silent one outside rich output mode."""
+    if output_mode != "rich":
+        return _SilentSpinner()
+    return yaspin(kind, text=text)
+
+
+class ProgressBus:
+    """
+    Progress counters and events published by the engine. Updating a counter
+    only takes a lock; drawing happens on a ProgressRenderer thread at a fixed
+    frame rate, so UI cost does not grow with the number of files. Events
+    (phase boundaries and messages) are also passed to subscribed sinks such
+    as the debug log.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._events = deque()
+        self._sinks = []
+        self.phase: Optional[str] = None
+        self.label = ""
+        self.phase_started = 0.0
+        self.durations: Dict[str, float] = {}
+        self.done = 0
+        self.total: Optional[int] = None
+        self.bytes = 0
+
+    def subscribe(self, sink):
+        """Call sink(event_dict) for every event."""
+        self._sinks.append(sink)
+
+    def emit(self, event: str, **fields):
+        record = {"event": event, "time": round(time.time(), 3), **fields}
+        with self._lock:
+            self._events.append(record)
+        for sink in self._sinks:
+            sink(record)
+
+    def message(self, text: str, level: str = "info"):
+        self.emit("message", level=level, text=text)
+
+    def start_phase(self, name: str, label: str):
+        """Start a phase, ending the current one."""
+        self.end_phase()
+        with self._lock:
+            self.phase, self.label = name, label
+            self.phase_started = time.perf_counter()
+            self.done, self.total, self.bytes = 0, None, 0
+        self.emit("phase_start", phase=name, label=label)
+
+    def end_phase(self, status: str = "ok"):
+        if self.phase is None:
+            return
+        with self._lock:
+            name, self.phase = self.phase, None
+            duration = time.perf_counter() - self.phase_started
+            self.durations[name] = self.durations.get(name, 0.0) + duration
+            done, total, nbytes = self.done, self.total, self.bytes
+        self.emit(
+            "phase_end",
+            phase=name,
+            label=self.label,
+            status=status,
+            duration=round(duration, 3),
+            done=done,
+            total=total,
+            bytes=nbytes,
+        )
+
+    def update(self, done: int, total: Optional[int] = None, nbytes: int = 0):
+        """Set the current phase's counters."""
+        with self._lock:
+            self.done, self.total, self.bytes = done, total, nbytes
+
+    def advance(self, count: int = 1, nbytes: int = 0):
+        with self._lock:
+            self.done += count
+            self.bytes += nbytes
+
+    def set_total(self, total: Optional[int]):
+        with self._lock:
+            self.total = total
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "phase": self.phase,
+                "label": self.label,
+                "done": self.done,
+                "total": self.total,
+                "bytes": self.bytes,
+            }
+
+    def drain(self) -> List[Dict[str, Any]]:
+        """Take the events published since the last call."""
+        with self._lock:
+            events = list(self._events)
+            self._events.clear()
+        return events
+
+
+class ProgressRenderer:
+    """Draws a ProgressBus on its own thread at a fixed frame rate."""
+
+    def __init__(self, bus: ProgressBus, fps: float = 10):
+        self.bus = bus
+        self.interval = 1.0 / fps
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._loop, name="thunderinex-progress", daemon=True
+        )
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+        self.frame()  # Flush whatever was published last
+        self.close()
+
+    def _loop(self):
+        while not self._stop.wait(self.interval):
+            self.frame()
+
+    def frame(self):
+        for event in self.bus.drain():
+            self.on_event(event)
+        self.draw(self.bus.snapshot())
+
+    def on_event(self, event: Dict[str, Any]):
+        pass
+
+    def draw(self, state: Dict[str, Any]):
+        pass
+
+    def close(self):
+        pass
+
+
+class RichProgressRenderer(ProgressRenderer):
+    """One Rich progress row per phase, redrawn only by the renderer thread."""
+
+    def __init__(self, bus: ProgressBus, fps: float = 10):
+        super().__init__(bus, fps)
+        self.progress = Progress(
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TextColumn("{task.fields[done_text]}/{task.fields[total_text]}"),
+            TimeRemainingColumn(),
+            console=console,
+            auto_refresh=False,
+        )
+        self.task = None
+        self.progress.start()
+
+    def on_event(self, event):
+        kind = event["event"]
+        if kind == "phase_start":
+            self.task = self.progress.add_task(
+                f"[cyan]{event['label']}...", total=None, done_text="0", total_text="?"
+            )
+        elif kind == "phase_end" and self.task is not None:
+            mark = "[green]✓[/green]" if event["status"] == "ok" else "[red]✗[/red]"
+            done = max(event["done"], 1)
+            self.progress.update(
+                self.task,
+                description=f"{mark} {event['label']} ({event['duration']:.2f}s)",
+                completed=done,
+                total=done,
+                done_text=str(event["done"]),
+                total_text=str(event["done"]),
+            )
+            self.task = None
+        elif kind == "message":
+            self.progress.console.print(f"[{event['level']}]{event['text']}[/{event['level']}]")
+
+    def draw(self, state):
+        if self.task is not None and state["phase"] is not None:
+            total = state["total"]
+            self.progress.update(
+                self.task,
+                completed=state["done"],
+                total=total,
+                done_text=str(state["done"]),
+                total_text="?" if total is None else str(total),
+            )
+        self.progress.refresh()
+
+    def close(self):
+        self.progress.stop()
+
+
+class PlainProgressRenderer(ProgressRenderer):
+    """Plain text for --quiet: one line per finished phase and per message."""
+
+    def on_event(self, event):
+        if event["event"] == "phase_end":
+            mark = "ok" if event["status"] == "ok" else event["status"]
+            size = f", {event['bytes'] / (1024 * 1024):.1f} MB" if event["bytes"] else ""
+            print(
+                f"[{mark}] {event['label']}: {event['done']} items{size} in {event['duration']:.2f}s",
+                flush=True,
+            )
+        elif event["event"] == "message":
+            print(f"[{event['level']}] {event['text']}", flush=True)
+
+
+class JsonProgressRenderer(ProgressRenderer):
+    """
+    Streams events as JSON lines for --json, plus a "progress" line with the
+    current counters at most once per interval while they change.
+    """
+
+    def __init__(self, bus: ProgressBus, fps: float = 10, interval: float = 1.0):
+        super().__init__(bus, fps)
+        self.progress_interval = interval
+        self._last_state = None
+        self._last_emit = 0.0
+
+    def on_event(self, event):
+        emit_json(event)
+
+    def draw(self, state):
+        now = time.monotonic()
+        if (
+            state["phase"] is None
+            or state == self._last_state
+            or now - self._last_emit < self.progress_interval
+        ):
+            return
+        self._last_state, self._last_emit = state, now
+        emit_json({"event": "progress", "time": round(time.time(), 3), **state})
+
+
+class _JsonErrorHandler(logging.Handler):
+    """Collects logged errors for the --json result and streams them."""
+
+    def __init__(self):
+        super().__init__(logging.ERROR)
+        self.errors: List[str] = []
+
+    def emit(self, record):
+        message = record.getMessage()
+        self.errors.append(message)
+        emit_json({"event": "error", "time": round(time.time(), 3), "text": message})
+
+
+class DebugLog(logging.Handler):
+    """
+    Ring buffer of debug events, flushed to a rotating log file.
+    Structured events are stored unformatted as (time, name, fields) and
+    only rendered as JSON lines on flush, so hot loops pay for one tuple.
+    Logger's own records land in the same buffer; errors flush it at once.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        capacity: int = 10000,
+        max_bytes: int = 1024 * 1024,
+        backups: int = 3,
+    ):
+        super().__init__(logging.DEBUG)
+        self.path = path
+        self.buffer: deque = deque(maxlen=capacity)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.file = logging.handlers.RotatingFileHandler(
+            path, maxBytes=max_bytes, backupCount=backups, encoding="utf-8", delay=True
+        )
+
+    def record(self, name: str, fields: Dict[str, Any]):
+        self.buffer.append((time.time(), name, fields))
+
+    def emit(self, record):
+        self.buffer.append(
+            (record.created, record.levelname.lower(), {"text": record.getMessage()})
+        )
+        if record.levelno >= logging.ERROR:
+            self.flush()
+
+    def flush(self):
+        """Write buffered events to the log file, oldest first."""
+        while True:
+            try:
+                created, name, fields = self.buffer.popleft()
+            except IndexError:
+                break
+            line = json.dumps(
+                {"time": round(created, 3), "name": name, **fields}, default=str
+            )
+            self.file.handle(logging.makeLogRecord({"msg": line, "created": created}))
+        self.file.flush()
+
+    def close(self):
+        # logging.shutdown() closes every handler at exit
+        self.flush()
+        self.file.close()
+        super().close()
+
+
+debug_log: Optional[DebugLog] = None
+
+
+def debug_event(name: str, **fields):
+    """Record a structured debug event; a no-op unless debug logging is on."""
+    if debug_log is not None:
+        debug_log.buffer.append((time.time(), name, fields))
+
+
+def enable_debug_log(path: str, echo: bool = False) -> DebugLog:
+    """
+    Capture debug events and Logger records to the rotating log at path.
+    Warnings and errors still reach stderr (every record with echo).
+    """
+    global debug_log
+    if debug_log is None:
+        if not Logger.handlers:
+            # Keep what logging's last-resort handler printed before
+            stream = logging.StreamHandler()
+            stream.setLevel(logging.DEBUG if echo else logging.WARNING)
+            Logger.addHandler(stream)
+        debug_log = DebugLog(path)
+        Logger.addHandler(debug_log)
+        Logger.setLevel(logging.DEBUG)
+    return debug_log
+
+
+def make_renderer(bus: ProgressBus) -> ProgressRenderer:
+    """Pick the renderer for the current output mode."""
+    if output_mode == "json":
+        return JsonProgressRenderer(bus)
+    if output_mode == "plain":
+        return PlainProgressRenderer(bus)
+    return RichProgressRenderer(bus)
+
+
 def show_rendered_text():
     console = Console()
     f = Figlet(font="small")
@@ -122,10 +510,1394 @@ def clear_console():
     show_rendered_text()
 
 
+# Files BepInEx regenerates at runtime and that never need to be copied
+DEFAULT_EXCLUDE_PATTERNS = [
+    "/cache",
+    "/DumpedAssemblies",
+    "LogOutput.log*",
+    "ErrorLog*",
+    "*.tmp",
+]
+
+
+class PathFilter:
+    """Glob-based include/exclude rules, compiled once and matched per entry.
+
+    Patterns without a slash match an entry name at any depth, patterns with a
+    slash (or a leading "/" to anchor them) match the path relative to the
+    copy root. Matching ignores case.
+    """
+
+    def __init__(
+        self, include: Optional[List[str]] = None, exclude: Optional[List[str]] = None
+    ):
+        self.include = list(include or [])
+        self.exclude = list(exclude or [])
+        self._include_name, self._include_path = self._compile(self.include)
+        self._exclude_name, self._exclude_path = self._compile(self.exclude)
+
+    @staticmethod
+    def _compile(patterns: List[str]):
+        """Compile patterns into one name regex and one relative-path regex."""
+        name_parts, path_parts = [], []
+        for pattern in patterns:
+            pattern = pattern.strip().replace("\\", "/")
+            anchored = pattern.startswith("/")
+            pattern = pattern.strip("/")
+            if not pattern:
+                continue
+            target = path_parts if anchored or "/" in pattern else name_parts
+            target.append(fnmatch.translate(pattern))
+
+        def join(parts):
+            return re.compile("|".join(parts), re.IGNORECASE) if parts else None
+
+        return join(name_parts), join(path_parts)
+
+    @staticmethod
+    def _matches(name_re, path_re, rel_path: str, name: str) -> bool:
+        if name_re is not None and name_re.match(name):
+            return True
+        return path_re is not None and bool(path_re.match(rel_path))
+
+    def excludes(self, rel_path: str, name: str) -> bool:
+        """Return True if the entry (file or directory) should be skipped."""
+        return self._matches(self._exclude_name, self._exclude_path, rel_path, name)
+
+    def includes_file(self, rel_path: str, name: str) -> bool:
+        """Return True if a file passes both the include and exclude rules."""
+        if self.excludes(rel_path, name):
+            return False
+        if not self.include:
+            return True
+        return self._matches(self._include_name, self._include_path, rel_path, name)
+
+
+class OperationCancelled(Exception):
+    """Raised at a checkpoint once the operation's CancelToken is cancelled."""
+
+
+class CancelToken:
+    """
+    Cooperative cancellation flag shared by every stage and worker of one
+    operation. Long loops call check() between directories, files and
+    chunks, so a cancel stops all workers within one chunk of work.
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+        self.reason = "Canceled"
+        self._children: List["CancelToken"] = []
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self, reason: str = "Canceled"):
+        self.reason = reason
+        self._event.set()
+        for child in list(self._children):
+            child.cancel(reason)
+
+    def child(self) -> "CancelToken":
+        """
+        A token that is cancelled along with this one but can also be
+        cancelled on its own, so a stage can stop its workers without
+        cancelling the whole operation.
+        """
+        token = CancelToken()
+        self._children.append(token)
+        if self.cancelled:
+            token.cancel(self.reason)
+        return token
+
+    def check(self):
+        if self._event.is_set():
+            raise OperationCancelled(self.reason)
+
+    def wait(self, timeout: float) -> bool:
+        """Sleep up to timeout seconds; returns True as soon as cancelled."""
+        return self._event.wait(timeout)
+
+
+class RealFS:
+    """
+    Thin filesystem interface used by the copy, search and backup paths.
+    Each method mirrors the os / shutil function of the same name; swap in a
+    SimulatedFS to benchmark or fault-test those paths on any disk.
+    """
+
+    def open(self, path: str, mode: str = "rb"):
+        return open(path, mode)
+
+    def stat(self, path: str) -> os.stat_result:
+        return os.stat(path)
+
+    def lstat(self, path: str) -> os.stat_result:
+        return os.lstat(path)
+
+    def scandir(self, path: str):
+        return os.scandir(path)
+
+    def listdir(self, path: str) -> List[str]:
+        return os.listdir(path)
+
+    def walk(self, top: str):
+        return os.walk(top)
+
+    def exists(self, path: str) -> bool:
+        return os.path.exists(path)
+
+    def lexists(self, path: str) -> bool:
+        return os.path.lexists(path)
+
+    def isdir(self, path: str) -> bool:
+        return os.path.isdir(path)
+
+    def makedirs(self, path: str, exist_ok: bool = True):
+        os.makedirs(path, exist_ok=exist_ok)
+
+    def link(self, src: str, dst: str):
+        os.link(src, dst)
+
+    def unlink(self, path: str):
+        os.unlink(path)
+
+    def rmdir(self, path: str):
+        os.rmdir(path)
+
+    def rename(self, src: str, dst: str):
+        os.rename(src, dst)
+
+    def replace(self, src: str, dst: str):
+        os.replace(src, dst)
+
+    def utime(self, path: str, ns: Tuple[int, int]):
+        os.utime(path, ns=ns)
+
+    def rmtree(self, path: str, ignore_errors: bool = False):
+        shutil.rmtree(path, ignore_errors=ignore_errors)
+
+    def copyfile(self, src: str, dst: str):
+        shutil.copyfile(src, dst)
+
+    def copystat(self, src: str, dst: str):
+        shutil.copystat(src, dst)
+
+
+REAL_FS = RealFS()
+
+
+class _SimulatedFile:
+    """File wrapper that charges SimulatedFS throughput and space per call."""
+
+    def __init__(self, fs: "SimulatedFS", f, path: str):
+        self._fs = fs
+        self._f = f
+        self._path = path
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._f.read(size)
+        self._fs._transfer(len(data))
+        return data
+
+    def readinto(self, buffer) -> int:
+        read = self._f.readinto(buffer)
+        self._fs._transfer(read or 0)
+        return read
+
+    def write(self, data) -> int:
+        self._fs._allocate(self._path, len(data))
+        self._fs._transfer(len(data))
+        return self._f.write(data)
+
+    def __getattr__(self, name):
+        return getattr(self._f, name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self._f.close()
+
+
+class SimulatedFS(RealFS):
+    """
+    RealFS with injected costs and faults, so parallelism, strategy choices
+    and rollback can be measured and tested deterministically:
+
+    - latency: seconds added to every metadata operation and open
+    - throughput_mbps: shared cap on file data read and written
+    - capacity: bytes that may be written before writes fail with ENOSPC
+    - lock(pattern): matching paths refuse writes, renames and deletes the
+      way files held open by a running game do on Windows
+    - fail(op, pattern, code): any other operation raises OSError(code)
+
+    Files still live on the real disk underneath (use a temporary or tmpfs
+    directory), and the mmap copy path bypasses the throughput cap.
+    """
+
+    PROFILES = {
+        "hdd": {"latency": 0.008, "throughput_mbps": 120},
+        "smb": {"latency": 0.003, "throughput_mbps": 40},
+        "usb": {"latency": 0.001, "throughput_mbps": 25},
+    }
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        throughput_mbps: float = 0,
+        capacity: Optional[int] = None,
+    ):
+        self.latency = latency
+        rate = throughput_mbps * 1024 * 1024
+        # A small burst, so short runs see the cap too
+        self.bucket = TokenBucket(rate, min(rate, 1024 * 1024)) if rate > 0 else None
+        self.capacity = capacity
+        self.written = 0
+        self.faults: List[Tuple[str, str, int]] = []  # (op, pattern, errno)
+        self.calls: Counter = Counter()
+        self.profile: Optional[str] = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_profile(cls, name: str, **overrides) -> "SimulatedFS":
+        fs = cls(**{**cls.PROFILES[name], **overrides})
+        fs.profile = name
+        return fs
+
+    def fail(self, op: str, pattern: str, code: int = errno.EIO):
+        """Make op ("open", "write", "stat", "replace", ...) fail on matching paths."""
+        self.faults.append((op, pattern, code))
+
+    def lock(self, pattern: str):
+        """Refuse writes, renames and deletes of matching paths."""
+        for op in ("write", "unlink", "rename", "replace", "rmdir"):
+            self.fail(op, pattern, errno.EACCES)
+
+    def _op(self, op: str, *paths: str):
+        with self._lock:
+            self.calls[op] += 1
+        for fault_op, pattern, code in self.faults:
+            if fault_op != op:
+                continue
+            for path in paths:
+                if fnmatch.fnmatch(path.replace(os.sep, "/"), pattern):
+                    raise OSError(code, os.strerror(code), path)
+        if self.latency:
+            time.sleep(self.latency)
+
+    def _transfer(self, amount: int):
+        if self.bucket is not None and amount:
+            self.bucket.consume(amount)
+
+    def _allocate(self, path: str, amount: int):
+        if self.capacity is None:
+            return
+        with self._lock:
+            if self.written + amount > self.capacity:
+                raise OSError(errno.ENOSPC, os.strerror(errno.ENOSPC), path)
+            self.written += amount
+
+    def open(self, path: str, mode: str = "rb"):
+        writing = any(flag in mode for flag in "wax+")
+        self._op("write" if writing else "open", path)
+        return _SimulatedFile(self, open(path, mode), path)
+
+    def stat(self, path: str) -> os.stat_result:
+        self._op("stat", path)
+        return os.stat(path)
+
+    def lstat(self, path: str) -> os.stat_result:
+        self._op("stat", path)
+        return os.lstat(path)
+
+    def scandir(self, path: str):
+        self._op("scandir", path)
+        return os.scandir(path)
+
+    def listdir(self, path: str) -> List[str]:
+        self._op("scandir", path)
+        return os.listdir(path)
+
+    def walk(self, top: str):
+        for step in os.walk(top):
+            self._op("scandir", step[0])
+            yield step  # Callers may still prune step[1]
+
+    def exists(self, path: str) -> bool:
+        self._op("stat", path)
+        return os.path.exists(path)
+
+    def lexists(self, path: str) -> bool:
+        self._op("stat", path)
+        return os.path.lexists(path)
+
+    def isdir(self, path: str) -> bool:
+        self._op("stat", path)
+        return os.path.isdir(path)
+
+    def makedirs(self, path: str, exist_ok: bool = True):
+        self._op("makedirs", path)
+        os.makedirs(path, exist_ok=exist_ok)
+
+    def link(self, src: str, dst: str):
+        self._op("link", src, dst)
+        os.link(src, dst)
+
+    def unlink(self, path: str):
+        self._op("unlink", path)
+        os.unlink(path)
+
+    def rmdir(self, path: str):
+        self._op("rmdir", path)
+        os.rmdir(path)
+
+    def rename(self, src: str, dst: str):
+        self._op("rename", src, dst)
+        os.rename(src, dst)
+
+    def replace(self, src: str, dst: str):
+        self._op("replace", src, dst)
+        os.replace(src, dst)
+
+    def utime(self, path: str, ns: Tuple[int, int]):
+        self._op("utime", path)
+        os.utime(path, ns=ns)
+
+    def rmtree(self, path: str, ignore_errors: bool = False):
+        def remove(fn, target):
+            try:
+                fn(target)
+            except OSError:
+                if not ignore_errors:
+                    raise
+
+        for root, dirs, files in os.walk(path, topdown=False):
+            for name in files:
+                remove(self.unlink, os.path.join(root, name))
+            for name in dirs:
+                remove(self.rmdir, os.path.join(root, name))
+        remove(self.rmdir, path)
+
+    def copyfile(self, src: str, dst: str):
+        with self.open(src, "rb") as fsrc, self.open(dst, "wb") as fdst:
+            for chunk in iter(lambda: fsrc.read(1024 * 1024), b""):
+                fdst.write(chunk)
+
+    def copystat(self, src: str, dst: str):
+        self._op("utime", dst)
+        shutil.copystat(src, dst)
+
+
+def scan_copy_plan(
+    src: str,
+    path_filter: PathFilter,
+    skipped: Optional[Counter] = None,
+    cancel: Optional[CancelToken] = None,
+    fs: Optional[RealFS] = None,
+) -> Iterator[Tuple[str, List[Tuple[str, int]]]]:
+    """
+    Walk src and yield (relative_dir, [(file_name, size), ...]) per directory.
+    Excluded directories are pruned without being listed. Excluded entries are
+    counted in skipped ("files", "bytes", "dirs") when given.
+    """
+    fs = fs or REAL_FS
+    pending = [""]
+    while pending:
+        if cancel is not None:
+            cancel.check()
+        rel_dir = pending.pop()
+        files = []
+        subdirs = []
+        with fs.scandir(os.path.join(src, rel_dir) if rel_dir else src) as it:
+            for entry in it:
+                rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    if not path_filter.excludes(rel_path, entry.name):
+                        subdirs.append(rel_path)
+                    elif skipped is not None:
+                        skipped["dirs"] += 1
+                elif path_filter.includes_file(rel_path, entry.name):
+                    files.append((entry.name, entry.stat().st_size))
+                elif skipped is not None:
+                    skipped["files"] += 1
+                    skipped["bytes"] += entry.stat().st_size
+        yield rel_dir, files
+        pending.extend(reversed(subdirs))
+
+
+def scan_parallel(
+    items: List[str],
+    fn,
+    workers: int = 8,
+    timeout: Optional[float] = None,
+    cancel: Optional[CancelToken] = None,
+) -> Tuple[Dict[str, Any], List[str]]:
+    """
+    Run fn(item) for every item on daemon worker threads and collect results.
+    A call running longer than timeout seconds (a hung network mount, say) is
+    abandoned and reported instead; its thread finishes in the background and
+    never blocks exit. Failed calls are logged and left out. Raises
+    OperationCancelled as soon as cancel is cancelled.
+    Returns ({item: result}, [timed_out_items]).
+    """
+    results: Dict[str, Any] = {}
+    timed_out: List[str] = []
+    if not items:
+        return results, timed_out
+
+    todo = deque(items)
+    started: Dict[str, float] = {}
+    finished = queue.Queue()
+    lock = threading.Lock()
+
+    def worker():
+        while True:
+            with lock:
+                if not todo or (cancel is not None and cancel.cancelled):
+                    return
+                item = todo.popleft()
+                started[item] = time.monotonic()
+            try:
+                finished.put((item, fn(item), None))
+            except Exception as e:
+                finished.put((item, None, e))
+
+    count = max(1, min(workers, len(items)))
+    for _ in range(count):
+        threading.Thread(target=worker, name="thunderinex-scan", daemon=True).start()
+
+    remaining = len(items)
+    stuck = 0  # Workers still busy with an abandoned item
+    while remaining:
+        if cancel is not None:
+            cancel.check()
+        try:
+            item, value, error = finished.get(
+                timeout=0.05 if timeout or cancel is not None else None
+            )
+        except queue.Empty:
+            if not timeout:
+                continue
+            now = time.monotonic()
+            with lock:
+                for item, start in list(started.items()):
+                    if now - start > timeout:
+                        del started[item]
+                        timed_out.append(item)
+                        remaining -= 1
+                        stuck += 1
+                        Logger.warning(f"Scanning {item} timed out after {timeout}s")
+                if stuck >= count:
+                    # Every worker is hung; nothing queued will ever start
+                    timed_out.extend(todo)
+                    remaining -= len(todo)
+                    todo.clear()
+            continue
+
+        with lock:
+            if started.pop(item, None) is None:
+                stuck -= 1  # Late result for an abandoned item
+                continue
+        remaining -= 1
+        if isinstance(error, OperationCancelled):
+            raise error
+        if error is not None:
+            Logger.error(f"Error scanning {item}: {error}")
+        else:
+            results[item] = value
+
+    return results, timed_out
+
+
+def hash_file(
+    path: str,
+    chunk_size: int = 1024 * 1024,
+    cancel: Optional[CancelToken] = None,
+    fs: Optional[RealFS] = None,
+) -> str:
+    """Return the SHA-256 hex digest of a file."""
+    digest = hashlib.sha256()
+    with (fs or REAL_FS).open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            if cancel is not None:
+                cancel.check()
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class FileManifest:
+    """
+    Column-oriented record of the files in a tree, sized for 100k+ entries.
+    Directory prefixes are interned in a table and per-file sizes, mtimes and
+    SHA-256 digests live in typed arrays, so each file costs its name plus a
+    few dozen bytes instead of a path string and a list. Rows are addressed
+    by index; lookups by relative path use a per-directory name index built
+    on first use. Mutate from one thread at a time.
+    """
+
+    __slots__ = (
+        "dirs",
+        "_dir_ids",
+        "dir_ids",
+        "names",
+        "sizes",
+        "mtimes",
+        "installed_mtimes",
+        "digests",
+        "_index",
+        "_removed",
+    )
+
+    FORMAT = 2
+    _NO_DIGEST = bytes(32)
+
+    def __init__(self):
+        self.dirs: List[str] = []
+        self._dir_ids: Dict[str, int] = {}
+        self.dir_ids = array("I")
+        self.names: List[Optional[str]] = []  # None marks a removed row
+        self.sizes = array("q")
+        self.mtimes = array("q")  # Source mtime in ns, 0 if unknown
+        self.installed_mtimes = array("q")  # Installed copy's mtime in ns, 0 if unknown
+        self.digests = bytearray()  # 32 bytes per row, zeros when not hashed
+        self._index: Optional[Dict[int, Dict[str, int]]] = None
+        self._removed = 0
+
+    def intern_dir(self, rel_dir: str) -> int:
+        dir_id = self._dir_ids.get(rel_dir)
+        if dir_id is None:
+            dir_id = self._dir_ids[rel_dir] = len(self.dirs)
+            self.dirs.append(rel_dir)
+        return dir_id
+
+    def add(
+        self, rel_dir: str, name: str, size: int, mtime: int = 0, installed_mtime: int = 0
+    ) -> int:
+        """Append a file and return its row."""
+        row = len(self.names)
+        dir_id = self.intern_dir(rel_dir)
+        self.dir_ids.append(dir_id)
+        self.names.append(name)
+        self.sizes.append(size)
+        self.mtimes.append(mtime)
+        self.installed_mtimes.append(installed_mtime)
+        self.digests += self._NO_DIGEST
+        if self._index is not None:
+            self._index.setdefault(dir_id, {})[name] = row
+        return row
+
+    def add_path(self, rel_path: str, size: int, mtime: int = 0, installed_mtime: int = 0) -> int:
+        rel_dir, _, name = rel_path.rpartition("/")
+        return self.add(rel_dir, name, size, mtime, installed_mtime)
+
+    def remove(self, rel_path: str):
+        row = self.find(rel_path)
+        if row is not None:
+            del self._index[self.dir_ids[row]][self.names[row]]
+            self.names[row] = None
+            self._removed += 1
+
+    def path(self, row: int) -> str:
+        rel_dir = self.dirs[self.dir_ids[row]]
+        return f"{rel_dir}/{self.names[row]}" if rel_dir else self.names[row]
+
+    def find(self, rel_path: str) -> Optional[int]:
+        """Row of a relative path, or None."""
+        if self._index is None:
+            self._index = {}
+            for row, name in enumerate(self.names):
+                if name is not None:
+                    self._index.setdefault(self.dir_ids[row], {})[name] = row
+        rel_dir, _, name = rel_path.rpartition("/")
+        dir_id = self._dir_ids.get(rel_dir)
+        if dir_id is None:
+            return None
+        return self._index.get(dir_id, {}).get(name)
+
+    def rows(self) -> Iterator[int]:
+        for row, name in enumerate(self.names):
+            if name is not None:
+                yield row
+
+    def __len__(self) -> int:
+        return len(self.names) - self._removed
+
+    def __iter__(self) -> Iterator[str]:
+        return (self.path(row) for row in self.rows())
+
+    def __contains__(self, rel_path: str) -> bool:
+        return self.find(rel_path) is not None
+
+    def digest(self, row: int) -> Optional[str]:
+        raw = bytes(self.digests[row * 32 : row * 32 + 32])
+        return None if raw == self._NO_DIGEST else raw.hex()
+
+    def set_digest(self, row: int, digest: Optional[str]):
+        self.digests[row * 32 : row * 32 + 32] = (
+            bytes.fromhex(digest) if digest else self._NO_DIGEST
+        )
+
+    def record(self, row: int) -> List[int]:
+        """[size, mtime, installed mtime] of a row."""
+        return [self.sizes[row], self.mtimes[row], self.installed_mtimes[row]]
+
+    def to_json(self) -> Dict[str, Any]:
+        """
+        Compact column form: the directory table plus one list per column.
+        Columns that are all zero (never recorded) are left out.
+        """
+        live = list(self.rows())
+        data: Dict[str, Any] = {
+            "format": self.FORMAT,
+            "dirs": self.dirs,
+            "dir": [self.dir_ids[row] for row in live],
+            "name": [self.names[row] for row in live],
+            "size": [self.sizes[row] for row in live],
+        }
+        for key, column in (("mtime", self.mtimes), ("installed_mtime", self.installed_mtimes)):
+            values = [column[row] for row in live]
+            if any(values):
+                data[key] = values
+        digests = [self.digest(row) for row in live]
+        if any(digests):
+            data["sha256"] = digests
+        return data
+
+    @classmethod
+    def from_json(cls, data: Any) -> "FileManifest":
+        """
+        Load the column form, or the older {relative_path: [size, sha256]}
+        and {relative_path: [size, mtime, installed_mtime]} mappings.
+        """
+        manifest = cls()
+        if not data:
+            return manifest
+
+        if "format" not in data:
+            for rel_path, record in data.items():
+                if len(record) >= 3:
+                    manifest.add_path(rel_path, record[0], record[1], record[2])
+                else:
+                    row = manifest.add_path(rel_path, record[0])
+                    manifest.set_digest(row, record[1] if len(record) > 1 else None)
+            return manifest
+
+        manifest.dirs = list(data["dirs"])
+        manifest._dir_ids = {rel_dir: i for i, rel_dir in enumerate(manifest.dirs)}
+        count = len(data["name"])
+        manifest.dir_ids = array("I", data["dir"])
+        manifest.names = list(data["name"])
+        manifest.sizes = array("q", data["size"])
+        manifest.mtimes = array("q", data.get("mtime") or [0] * count)
+        manifest.installed_mtimes = array("q", data.get("installed_mtime") or [0] * count)
+        manifest.digests = bytearray(
+            b"".join(
+                bytes.fromhex(digest) if digest else cls._NO_DIGEST
+                for digest in data.get("sha256") or [None] * count
+            )
+        )
+        return manifest
+
+
+class TokenBucket:
+    """Thread-safe token bucket that caps bytes per second across all workers."""
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        self.rate = float(rate)
+        self.capacity = float(burst if burst is not None else rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def consume(self, amount: int, cancel: Optional[CancelToken] = None):
+        """Take amount tokens, sleeping until the budget allows it."""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.updated) * self.rate
+            )
+            self.updated = now
+            # Going into debt lets chunks larger than the burst through
+            self.tokens -= amount
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        if wait > 0:
+            if cancel is None:
+                time.sleep(wait)
+            elif cancel.wait(wait):
+                raise OperationCancelled(cancel.reason)
+
+
+def process_alive(pid: int) -> bool:
+    """Return True if a process with this id is running."""
+    if pid == os.getpid():
+        return True
+    if platform.system() == "Windows":
+        kernel32 = ctypes.windll.kernel32
+        # PROCESS_QUERY_LIMITED_INFORMATION
+        handle = kernel32.OpenProcess(0x1000, False, pid)
+        if not handle:
+            return kernel32.GetLastError() == 5  # Access denied: it exists
+        try:
+            exit_code = ctypes.c_ulong()
+            kernel32.GetExitCodeProcess(handle, ctypes.byref(exit_code))
+            return exit_code.value == 259  # STILL_ACTIVE
+        finally:
+            kernel32.CloseHandle(handle)
+    try:
+        os.kill(pid, 0)
+    except PermissionError:
+        return True
+    except OSError:
+        return False
+    return True
+
+
+_low_priority_applied = False
+
+
+def set_low_priority():
+    """
+    Lower this process's CPU and I/O priority so a running game keeps
+    responsive disk access. Threads started afterwards inherit it. Only the
+    first call has an effect; niceness would otherwise stack.
+    """
+    global _low_priority_applied
+    if _low_priority_applied:
+        return
+    _low_priority_applied = True
+
+    system = platform.system()
+    try:
+        if system == "Windows":
+            # PROCESS_MODE_BACKGROUND_BEGIN lowers CPU, I/O and memory priority
+            kernel32 = ctypes.windll.kernel32
+            kernel32.SetPriorityClass(kernel32.GetCurrentProcess(), 0x00100000)
+            return
+
+        os.nice(10)
+        if system == "Linux" and shutil.which("ionice"):
+            import subprocess
+
+            # Best-effort class at its lowest level; idle could starve installs
+            subprocess.run(
+                ["ionice", "-c", "2", "-n", "7", "-p", str(os.getpid())],
+                check=False,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+    except Exception as e:
+        Logger.error(f"Could not lower process priority: {e}")
+
+
+class BlobStore:
+    """
+    Content-addressed store of file blobs on one volume. Installs hardlink
+    files from the store, so each blob's link count doubles as its reference
+    count: a blob with no links outside the store can be collected.
+    """
+
+    DIR_NAME = ".thunderinex_store"
+
+    def __init__(self, root: str):
+        self.root = root
+        self.objects_dir = os.path.join(root, "objects")
+        self.index_path = os.path.join(root, "index.json")
+        # {source_path: [size, mtime_ns, sha256]} so unchanged sources aren't rehashed
+        self.index: Dict[str, List[Any]] = {}
+        if os.path.exists(self.index_path):
+            try:
+                with open(self.index_path, "r") as f:
+                    self.index = json.load(f)
+            except (OSError, ValueError) as e:
+                Logger.error(f"Error loading store index: {e}")
+
+    @classmethod
+    def for_path(
+        cls, path: str, store_dir: Optional[str] = None, fallback_dir: Optional[str] = None
+    ) -> Optional["BlobStore"]:
+        """
+        Open the store serving path. A configured store_dir is used as is;
+        otherwise the store sits in the Steam library holding path, or in
+        fallback_dir. Blobs are hardlinked, so the store must be writable and
+        on path's volume; returns None if no location is.
+        """
+        path = os.path.abspath(path)
+        try:
+            device = os.stat(path).st_dev
+        except OSError:
+            return None
+
+        if store_dir:
+            candidates = [os.path.abspath(store_dir)]
+        else:
+            candidates = []
+            parts = path.split(os.sep)
+            libraries = [i for i, part in enumerate(parts) if part.lower() == "steamapps"]
+            if libraries:
+                library = os.sep.join(parts[: libraries[-1]]) or os.sep
+                candidates.append(os.path.join(library, cls.DIR_NAME))
+            if fallback_dir:
+                candidates.append(os.path.join(fallback_dir, "store"))
+
+        for root in candidates:
+            # The store folder may not exist yet: check its nearest ancestor
+            existing = root
+            while not os.path.exists(existing) and os.path.dirname(existing) != existing:
+                existing = os.path.dirname(existing)
+            try:
+                if os.stat(existing).st_dev == device and os.access(existing, os.W_OK):
+                    return cls(root)
+            except OSError:
+                continue
+        return None
+
+    def blob_path(self, digest: str) -> str:
+        return os.path.join(self.objects_dir, digest[:2], digest[2:])
+
+    def digest_for(self, src: str) -> str:
+        """Hash a source file, reusing the index while size and mtime match."""
+        st = os.stat(src)
+        cached = self.index.get(src)
+        if cached and cached[0] == st.st_size and cached[1] == st.st_mtime_ns:
+            return cached[2]
+        digest = hash_file(src)
+        self.index[src] = [st.st_size, st.st_mtime_ns, digest]
+        return digest
+
+    def link(self, src: str, dst: str):
+        """Install src at dst as a hardlink to its blob, storing the blob if new."""
+        blob = self.blob_path(self.digest_for(src))
+        if not os.path.exists(blob):
+            os.makedirs(os.path.dirname(blob), exist_ok=True)
+            temp = f"{blob}.{threading.get_ident()}.tmp"
+            shutil.copy2(src, temp)
+            os.replace(temp, blob)
+        if os.path.lexists(dst):
+            os.unlink(dst)
+        os.link(blob, dst)
+
+    def save(self):
+        """Persist the source digest index."""
+        try:
+            os.makedirs(self.root, exist_ok=True)
+            with open(self.index_path + ".tmp", "w") as f:
+                json.dump(self.index, f)
+            os.replace(self.index_path + ".tmp", self.index_path)
+        except OSError as e:
+            Logger.error(f"Error saving store index: {e}")
+
+    def gc(self) -> Tuple[int, int]:
+        """Remove blobs nothing links to. Returns (blobs_removed, bytes_freed)."""
+        removed = freed = 0
+        live = set()
+        if os.path.isdir(self.objects_dir):
+            for root, _, files in os.walk(self.objects_dir):
+                for name in files:
+                    path = os.path.join(root, name)
+                    st = os.stat(path)
+                    if name.endswith(".tmp") or st.st_nlink <= 1:
+                        os.unlink(path)
+                        removed += 1
+                        freed += st.st_size
+                    else:
+                        live.add(os.path.basename(root) + name)
+
+        # Forget sources that point at collected blobs or no longer exist
+        self.index = {
+            src: entry
+            for src, entry in self.index.items()
+            if entry[2] in live and os.path.exists(src)
+        }
+        self.save()
+        return removed, freed
+
+
+class FileCopier:
+    """
+    Per-file copy engine that picks a strategy by size:
+
+    - "small": one read and one write
+    - "medium": shutil.copyfile, which uses the platform's fast copy
+    - "large": preallocated destination filled with large buffers or mmap
+    - "hardlink": linked from a BlobStore, for files matching store_filter
+
+    With a throttle, medium files are copied in chunks too so every byte
+    passes through the shared token bucket. Timestamps and permissions are
+    preserved like shutil.copy2. With a cancel token, chunked copies stop
+    between chunks and remove the partial file.
+    """
+
+    def __init__(
+        self,
+        small_threshold: int = 256 * 1024,
+        large_threshold: int = 32 * 1024 * 1024,
+        large_buffer_size: int = 8 * 1024 * 1024,
+        use_mmap: bool = False,
+        store: Optional[BlobStore] = None,
+        store_filter: Optional[PathFilter] = None,
+        throttle: Optional[TokenBucket] = None,
+        cancel: Optional[CancelToken] = None,
+        fs: Optional[RealFS] = None,
+    ):
+        self.small_threshold = small_threshold
+        self.large_threshold = large_threshold
+        self.large_buffer_size = max(64 * 1024, large_buffer_size)
+        self.use_mmap = use_mmap
+        self.store = store
+        self.store_filter = store_filter
+        self.throttle = throttle
+        self.cancel = cancel
+        self.fs = fs or REAL_FS
+
+    def strategy_for(self, size: int) -> str:
+        if size <= self.small_threshold:
+            return "small"
+        if size >= self.large_threshold:
+            return "large"
+        return "medium"
+
+    def copy(self, src: str, dst: str, size: int, rel_path: Optional[str] = None) -> str:
+        """
+        Copy src to dst and return the strategy used. rel_path is the file's
+        path inside the copied tree, matched against store_filter.
+        """
+        if self.cancel is not None:
+            self.cancel.check()
+        if self.store is not None:
+            name = os.path.basename(src)
+            if self.store_filter is None or self.store_filter.includes_file(
+                rel_path or name, name
+            ):
+                try:
+                    self.store.link(src, dst)
+                    return "hardlink"
+                except OSError as e:
+                    # Filesystems without hardlinks fall back to a plain copy
+                    debug_event("hardlink_failed", path=dst, error=e)
+
+        # Never write through a hardlink shared with the store or another game
+        try:
+            if self.fs.lstat(dst).st_nlink > 1:
+                self.fs.unlink(dst)
+        except FileNotFoundError:
+            pass
+
+        strategy = self.strategy_for(size)
+        if strategy == "small":
+            with self.fs.open(src, "rb") as fsrc:
+                data = fsrc.read()
+            if self.throttle is not None:
+                self.throttle.consume(len(data), self.cancel)
+            with self.fs.open(dst, "wb") as fdst:
+                fdst.write(data)
+        elif strategy == "medium" and self.throttle is None:
+            self.fs.copyfile(src, dst)
+        else:
+            try:
+                self._copy_chunked(src, dst, size, large=strategy == "large")
+            except OperationCancelled:
+                self.fs.unlink(dst)  # Never leave a half-written file behind
+                raise
+        self.fs.copystat(src, dst)
+        return strategy
+
+    def _copy_chunked(self, src: str, dst: str, size: int, large: bool):
+        buffer_size = self.large_buffer_size if large else 1024 * 1024
+        if self.throttle is not None:
+            # Small chunks keep throttled writes smooth instead of bursty
+            buffer_size = min(buffer_size, 1024 * 1024)
+
+        with self.fs.open(src, "rb") as fsrc, self.fs.open(dst, "wb") as fdst:
+            # Reserve the full extent up front to limit fragmentation
+            if large and hasattr(os, "posix_fallocate"):
+                try:
+                    os.posix_fallocate(fdst.fileno(), 0, size)
+                except OSError:
+                    pass  # Not supported by this filesystem
+
+            if large and self.use_mmap and size:
+                with mmap.mmap(fsrc.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                    for offset in range(0, len(view), buffer_size):
+                        if self.cancel is not None:
+                            self.cancel.check()
+                        if self.throttle is not None:
+                            self.throttle.consume(
+                                min(buffer_size, len(view) - offset), self.cancel
+                            )
+                        fdst.write(view[offset : offset + buffer_size])
+            else:
+                buffer = bytearray(buffer_size)
+                chunk = memoryview(buffer)
+                while True:
+                    if self.cancel is not None:
+                        self.cancel.check()
+                    read = fsrc.readinto(buffer)
+                    if not read:
+                        break
+                    if self.throttle is not None:
+                        self.throttle.consume(read, self.cancel)
+                    fdst.write(chunk[:read])
+
+            # Drop any preallocated tail if the source shrank meanwhile
+            fdst.truncate()
+
+
+class CopyPipeline:
+    """
+    Asyncio copy pipeline: a scanner lists directories and feeds work units to
+    copy workers through a bounded queue, and copied files are optionally
+    hashed by workers running alongside.
+
+    Two schedules are available:
+
+    - "size": scan the whole tree first and create every directory up front,
+      then hand out the most expensive units first. Files at or below the
+      copier's small threshold are batched per directory so metadata work
+      stays local; everything else is a unit of its own. Starting with the
+      biggest files keeps workers from idling behind a few huge asset bundles
+      at the end of the run.
+    - "stream": copy each file as soon as its directory has been listed.
+    """
+
+    # Rough per-file cost (open, create, copystat) expressed in bytes copied
+    FILE_COST = 64 * 1024
+
+    def __init__(
+        self,
+        src: str,
+        dst: str,
+        path_filter: PathFilter,
+        workers: int = 4,
+        hash_files: bool = False,
+        queue_size: int = 256,
+        on_progress=None,
+        copier: Optional[FileCopier] = None,
+        schedule: str = "size",
+        batch_files: int = 64,
+        batch_bytes: int = 8 * 1024 * 1024,
+        cancel: Optional[CancelToken] = None,
+        fs: Optional[RealFS] = None,
+    ):
+        self.src = src
+        self.dst = dst
+        self.path_filter = path_filter
+        self.workers = max(1, workers)
+        self.hash_files = hash_files
+        self.queue_size = max(1, queue_size)
+        self.on_progress = on_progress
+        self.fs = fs or REAL_FS
+        self.copier = copier or FileCopier(fs=self.fs)
+        self.schedule = schedule
+        self.batch_files = max(1, batch_files)
+        self.batch_bytes = max(1, batch_bytes)
+        self.parent_cancel = cancel
+        self.cancel = cancel
+
+        # Scheduler and utilization figures, filled in by run()
+        self.stats: Dict[str, Any] = {}
+        self._busy: List[float] = []
+        self._queue_samples = 0
+        self._queue_total = 0
+        self._queue_max = 0
+
+        self.strategies: Counter = Counter()
+        self.skipped: Counter = Counter()
+        self.files_found = 0
+        self.files_copied = 0
+        self.bytes_copied = 0
+        self.scan_done = False
+        # One row per planned file, filled in as files are copied and hashed
+        self.manifest = FileManifest()
+
+    def _report(self):
+        if self.on_progress:
+            self.on_progress(self)
+
+    async def _scan(self, loop, executor, copy_queue: asyncio.Queue):
+        """Stream schedule: queue each file as soon as its directory is listed."""
+        plan = scan_copy_plan(
+            self.src, self.path_filter, self.skipped, self.cancel, self.fs
+        )
+        while True:
+            step = await loop.run_in_executor(executor, next, plan, None)
+            if step is None:
+                break
+            rel_dir, files = step
+            await loop.run_in_executor(
+                executor, self.fs.makedirs, os.path.join(self.dst, rel_dir)
+            )
+            self.files_found += len(files)
+            for name, size in files:
+                await copy_queue.put([self.manifest.add(rel_dir, name, size)])
+        self.scan_done = True
+        self._report()
+
+    def _plan(self) -> List[List[int]]:
+        """
+        Size schedule: scan the whole tree, create its directories, and return
+        work units (lists of manifest rows) ordered by estimated cost.
+        """
+        units = []
+        for rel_dir, files in scan_copy_plan(
+            self.src, self.path_filter, self.skipped, self.cancel, self.fs
+        ):
+            self.fs.makedirs(os.path.join(self.dst, rel_dir))
+            batch, batch_size = [], 0
+            for name, size in files:
+                row = self.manifest.add(rel_dir, name, size)
+                if size > self.copier.small_threshold:
+                    units.append([row])
+                    continue
+                if batch and (
+                    len(batch) >= self.batch_files or batch_size + size > self.batch_bytes
+                ):
+                    units.append(batch)
+                    batch, batch_size = [], 0
+                batch.append(row)
+                batch_size += size
+            if batch:
+                units.append(batch)
+            self.files_found += len(files)
+
+        sizes = self.manifest.sizes
+        units.sort(
+            key=lambda unit: sum(sizes[row] for row in unit) + self.FILE_COST * len(unit),
+            reverse=True,
+        )
+        self.stats.update(
+            units=len(units), batches=sum(1 for unit in units if len(unit) > 1)
+        )
+        return units
+
+    async def _feed(self, units: List[List[int]], copy_queue: asyncio.Queue):
+        for unit in units:
+            await copy_queue.put(unit)
+
+    def _copy_file(
+        self, src: str, dst: str, size: int, rel_path: str
+    ) -> Tuple[str, int, int]:
+        """Copy one file; returns (strategy, source mtime, installed mtime)."""
+        strategy = self.copier.copy(src, dst, size, rel_path)
+        return strategy, self.fs.stat(src).st_mtime_ns, self.fs.stat(dst).st_mtime_ns
+
+    def _copy_unit(self, unit: List[int]) -> List[Tuple[str, int, int]]:
+        results = []
+        for row in unit:
+            if self.cancel is not None:
+                self.cancel.check()
+            rel_path = self.manifest.path(row)
+            results.append(
+                self._copy_file(
+                    os.path.join(self.src, rel_path),
+                    os.path.join(self.dst, rel_path),
+                    self.manifest.sizes[row],
+                    rel_path,
+                )
+            )
+        return results
+
+    async def _copy_worker(self, index, loop, executor, copy_queue, hash_queue):
+        while True:
+            depth = copy_queue.qsize()
+            self._queue_samples += 1
+            self._queue_total += depth
+            self._queue_max = max(self._queue_max, depth)
+
+            unit = await copy_queue.get()
+            try:
+                if unit is None:
+                    return
+                started = time.perf_counter()
+                results = await loop.run_in_executor(executor, self._copy_unit, unit)
+                self._busy[index] += time.perf_counter() - started
+
+                for row, (strategy, mtime, installed_mtime) in zip(unit, results):
+                    self.strategies[strategy] += 1
+                    self.manifest.mtimes[row] = mtime
+                    self.manifest.installed_mtimes[row] = installed_mtime
+                    self.files_copied += 1
+                    self.bytes_copied += self.manifest.sizes[row]
+                    if hash_queue is not None:
+                        await hash_queue.put(row)
+                self._report()
+            finally:
+                copy_queue.task_done()
+
+    async def _hash_worker(self, loop, executor, hash_queue):
+        while True:
+            row = await hash_queue.get()
+            try:
+                if row is None:
+                    return
+                digest = await loop.run_in_executor(
+                    executor,
+                    hash_file,
+                    os.path.join(self.dst, self.manifest.path(row)),
+                    1024 * 1024,
+                    self.cancel,
+                    self.fs,
+                )
+                self.manifest.set_digest(row, digest)
+            finally:
+                hash_queue.task_done()
+
+    async def _run(self):
+        # A failing worker stops this pipeline only, not the caller's operation
+        self.cancel = (
+            self.parent_cancel.child() if self.parent_cancel is not None else CancelToken()
+        )
+        loop = asyncio.get_running_loop()
+        copy_queue = asyncio.Queue(self.queue_size)
+        hash_queue = asyncio.Queue(self.queue_size) if self.hash_files else None
+        hashers = max(1, self.workers // 2) if self.hash_files else 0
+
+        with ThreadPoolExecutor(self.workers + hashers + 1) as executor:
+            if self.schedule == "size":
+                started = time.perf_counter()
+                units = await loop.run_in_executor(executor, self._plan)
+                self.stats["scan_seconds"] = round(time.perf_counter() - started, 3)
+                self.scan_done = True
+                self._report()
+
+            copy_started = time.perf_counter()
+            self._busy = [0.0] * self.workers
+            copiers = [
+                asyncio.ensure_future(
+                    self._copy_worker(index, loop, executor, copy_queue, hash_queue)
+                )
+                for index in range(self.workers)
+            ]
+            hashing = [
+                asyncio.ensure_future(self._hash_worker(loop, executor, hash_queue))
+                for _ in range(hashers)
+            ]
+
+            async def produce():
+                if self.schedule == "size":
+                    await self._feed(units, copy_queue)
+                else:
+                    await self._scan(loop, executor, copy_queue)
+                for _ in copiers:
+                    await copy_queue.put(None)
+
+            # The producer runs alongside the copiers so a failing (or
+            # cancelled) copier can never leave it blocked on a full queue.
+            producer = asyncio.ensure_future(produce())
+            try:
+                await asyncio.gather(producer, *copiers)
+                self._record_stats(time.perf_counter() - copy_started)
+                for _ in hashing:
+                    await hash_queue.put(None)
+                await asyncio.gather(*hashing)
+            except BaseException:
+                self.cancel.cancel()  # Stop threads still inside a unit
+                tasks = [producer] + copiers + hashing
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
+
+    def _record_stats(self, copy_seconds: float):
+        busy = sum(self._busy)
+        self.stats.update(
+            schedule=self.schedule,
+            workers=self.workers,
+            copy_seconds=round(copy_seconds, 3),
+            worker_busy=[round(b, 3) for b in self._busy],
+            utilization=round(busy / (self.workers * copy_seconds), 3)
+            if copy_seconds > 0
+            else 0.0,
+            queue_max=self._queue_max,
+            queue_mean=round(self._queue_total / self._queue_samples, 1)
+            if self._queue_samples
+            else 0.0,
+        )
+
+    def run(self) -> FileManifest:
+        """Run the pipeline to completion and return the install manifest."""
+        asyncio.run(self._run())
+        return self.manifest
+
+
+class InstallTransaction:
+    """
+    Replaces a game's BepInEx folder and doorstop files as one unit, for
+    installs and pack imports alike. begin() moves the existing folder
+    aside and stage() names the temporary copy of a doorstop file; commit()
+    swaps the staged files in. Until then, roll_back() removes the staged
+    files and the new folder and puts the previous folder back; after it,
+    retire() snapshots and deletes that folder in the background.
+    """
+
+    def __init__(self, installer: "ThunderModInstaller", game_dir: str):
+        self.installer = installer
+        self.fs = installer.fs
+        self.game_dir = game_dir
+        self.target = os.path.join(game_dir, "BepInEx")
+        self.aside: Optional[str] = None
+        self.staged: Dict[str, str] = {}  # {doorstop destination: temporary copy}
+        self.active = False
+
+    def begin(self, bus: ProgressBus):
+        """Move the existing BepInEx folder aside; failures now roll back."""
+        self.aside = self.installer._move_aside(self.target, bus)
+        self.active = True
+
+    def stage(self, destination: str) -> str:
+        """Return the temporary path to write a file swapped in at commit."""
+        partial = self.staged[destination] = destination + self.installer.PARTIAL_SUFFIX
+        return partial
+
+    def commit(self):
+        """Swap the staged files in. Nothing after this is rolled back."""
+        for destination, partial in self.staged.items():
+            self.fs.replace(partial, destination)
+        self.staged.clear()
+        self.active = False
+
+    def roll_back(self, what: str) -> Optional[bool]:
+        """
+        Undo an uncommitted transaction. Returns True if the previous folder
+        was restored, False if there was none, and None if restoring failed.
+        """
+        for partial in self.staged.values():
+            if self.fs.lexists(partial):
+                self.fs.unlink(partial)
+        self.staged.clear()
+        self.active = False
+        try:
+            return self.installer._roll_back(self.target, self.aside)
+        except OSError as e:
+            Logger.error(f"Error rolling back {what}: {e}")
+            console.print(
+                f"[error]Could not restore the previous BepInEx folder; "
+                f"it is kept at [path]{self.aside}[/path][/error]"
+            )
+            return None
+
+    def retire(self, bus: ProgressBus, warnings: List[str], on_written=None):
+        """Snapshot and delete the previous folder once committed."""
+        if self.aside is None:
+            return
+        snapshot = self.installer._after_commit(
+            bus,
+            warnings,
+            "retiring the previous BepInEx folder",
+            lambda: self.installer._retire(self.aside, self.game_dir, on_written),
+        )
+        if snapshot:
+            bus.message(f"Writing backup snapshot to {snapshot} in the background")
+
+
 class ThunderModInstaller:
-    def __init__(self, debug=False):
+    def __init__(self, debug=False, fs: Optional[RealFS] = None):
         """Initialize the ThunderMod Installer."""
         self.debug = debug
+
+        # Filesystem used by the copy, search and backup paths
+        self.fs = fs or REAL_FS
         if debug:
             Logger.setLevel(logging.DEBUG)
 
@@ -134,9 +1906,18 @@ class ThunderModInstaller:
             os.path.expanduser("~"), ".thundermod_config.json"
         )
 
+        # Directory for caches and catalogues that can be rebuilt at any time
+        self.cache_dir = os.path.join(os.path.expanduser("~"), ".thunderinex")
+
         # Load config if exists
         self.config = self._load_config()
 
+        # Debug events go to a ring buffer flushed to a rotating log file
+        if debug or self.config.get("debug_log", False):
+            enable_debug_log(
+                os.path.join(self.cache_dir, "logs", "thunderinex.log"), echo=debug
+            )
+
         # Common base paths for Thunderstore Mod Manager DataFolder
         self.base_paths = [
             os.path.expanduser("~/AppData/Roaming/Thunderstore Mod Manager/DataFolder"),
@@ -155,6 +1936,19 @@ class ThunderModInstaller:
         if self.config.get("custom_paths"):
             self.base_paths.extend(self.config.get("custom_paths"))
 
+        # Folders holding installed games, indexed for their executables;
+        # game_library_roots from config are scanned as well
+        self.library_roots = [
+            "C:/Program Files (x86)/Steam/steamapps/common",
+            "C:/Program Files/Epic Games",
+            "C:/Games",
+            os.path.expanduser("~/Games"),
+            os.path.expanduser("~/Desktop"),
+            os.path.expanduser("~/.local/share/Steam/steamapps/common"),
+            os.path.expanduser("~/Library/Application Support/Steam/steamapps/common"),
+        ]
+        self._exe_index_lock = threading.Lock()
+
         # Automatically detect which path exists
         self.thunderstore_path = self._find_thunderstore_path()
 
@@ -167,6 +1961,38 @@ class ThunderModInstaller:
         # Theme setting
         self.theme = self.config.get("theme", "default")
 
+        # Include/exclude rules applied to every copy plan
+        self.path_filter = self._build_path_filter()
+
+        # Prompts are disabled when running as a background service
+        self.interactive = True
+
+        # Warm caches reused by long-running sessions (see --serve)
+        self._game_index: List[Tuple[str, str]] = []
+        self._game_index_mtime: Optional[int] = None
+        self._hash_cache: Dict[str, Tuple[int, int, str]] = {}
+
+        # Per-game profile catalogue: {game_dir: {profile_name: record}}
+        self._catalogue_lock = threading.Lock()
+        self._measuring = set()
+        self._measure_queue: deque = deque()
+        self._measurer: Optional[threading.Thread] = None
+        self._deleting = set()
+        self._backup_pool: Optional[ThreadPoolExecutor] = None
+        self._throttle: Optional[TokenBucket] = None
+        self.profile_catalogue: Dict[str, Dict[str, Dict[str, Any]]] = (
+            self._load_cache("profiles.json")
+        )
+
+        # Installed plugin index: {plugin_dir: record}, loaded on first use
+        self._plugin_index: Optional[Dict[str, Dict[str, Any]]] = None
+
+        # Structured summary of the last install, reported by --json
+        self.last_result: Dict[str, Any] = {}
+
+        # Token of the running operation; Ctrl+C cancels it (see _cancellable)
+        self.cancel_token: Optional[CancelToken] = None
+
         Logger.debug(f"Thunderstore path: {self.thunderstore_path}")
 
     def _load_config(self) -> Dict[str, Any]:
@@ -178,6 +2004,31 @@ class ThunderModInstaller:
             "theme": "default",
             "auto_backup": True,
             "max_recent_games": 10,
+            "copy_include": [],
+            "copy_exclude": list(DEFAULT_EXCLUDE_PATTERNS),
+            "copy_workers": 4,
+            "hash_on_install": False,
+            "pipeline_queue_size": 256,
+            "copy_small_threshold_kb": 256,
+            "copy_large_threshold_mb": 32,
+            "copy_large_buffer_mb": 8,
+            "copy_use_mmap": False,
+            "dedup_store": False,
+            "dedup_patterns": ["*.dll"],
+            "dedup_store_dir": None,
+            "pack_compresslevel": 6,
+            "backup_format": "zip",
+            "max_backups": 5,
+            "throttle_mbps": 0,
+            "low_priority": False,
+            "copy_schedule": "size",
+            "copy_batch_files": 64,
+            "copy_batch_mb": 8,
+            "scan_workers": 8,
+            "scan_timeout": 10,
+            "debug_log": False,
+            "game_library_roots": [],
+            "exe_scan_depth": 3,
         }
 
         if os.path.exists(self.config_path):
@@ -198,30 +2049,160 @@ class ThunderModInstaller:
         except Exception as e:
             Logger.error(f"Error saving config: {e}")
 
-    def _add_recent_game(self, game_name: str, game_path: str, exe_path: str):
-        """Add a game to recent games list."""
+    def _load_cache(self, name: str) -> Dict[str, Any]:
+        """Load a JSON cache file from the cache directory."""
+        path = os.path.join(self.cache_dir, name)
+        if os.path.exists(path):
+            try:
+                with open(path, "r") as f:
+                    return json.load(f)
+            except Exception as e:
+                Logger.error(f"Error loading cache {name}: {e}")
+        return {}
+
+    def _save_cache(self, name: str, data: Dict[str, Any]):
+        """Atomically write a JSON cache file to the cache directory."""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            path = os.path.join(self.cache_dir, name)
+            with open(path + ".tmp", "w") as f:
+                json.dump(data, f)
+            os.replace(path + ".tmp", path)
+        except Exception as e:
+            Logger.error(f"Error saving cache {name}: {e}")
+
+    def _build_path_filter(self) -> PathFilter:
+        """Compile the include/exclude rules from configuration."""
+        return PathFilter(
+            include=self.config.get("copy_include", []),
+            exclude=self.config.get("copy_exclude", DEFAULT_EXCLUDE_PATTERNS),
+        )
+
+    def _build_copier(self, **overrides) -> FileCopier:
+        """Create the per-file copy engine from configuration."""
+        settings = {
+            "small_threshold": self.config.get("copy_small_threshold_kb", 256) * 1024,
+            "large_threshold": self.config.get("copy_large_threshold_mb", 32)
+            * 1024
+            * 1024,
+            "large_buffer_size": self.config.get("copy_large_buffer_mb", 8) * 1024 * 1024,
+            "use_mmap": self.config.get("copy_use_mmap", False),
+        }
+        settings["throttle"] = self._get_throttle()
+        settings["cancel"] = self.cancel_token
+        settings["fs"] = self.fs
+        settings.update(overrides)
+        return FileCopier(**settings)
+
+    def _build_pipeline(self, src: str, dst: str, **overrides) -> CopyPipeline:
+        """Create a copy pipeline from configuration."""
+        settings = {
+            "workers": self.config.get("copy_workers", 4),
+            "hash_files": self.config.get("hash_on_install", False),
+            "queue_size": self.config.get("pipeline_queue_size", 256),
+            "schedule": self.config.get("copy_schedule", "size"),
+            "batch_files": self.config.get("copy_batch_files", 64),
+            "batch_bytes": self.config.get("copy_batch_mb", 8) * 1024 * 1024,
+            "cancel": self.cancel_token,
+            "fs": self.fs,
+        }
+        settings.update(overrides)
+        return CopyPipeline(src, dst, self.path_filter, **settings)
+
+    def _get_throttle(self) -> Optional[TokenBucket]:
+        """Return the token bucket shared by every copy, or None if unthrottled."""
+        mbps = float(self.config.get("throttle_mbps", 0) or 0)
+        if mbps <= 0:
+            return None
+        rate = mbps * 1024 * 1024
+        if self._throttle is None or self._throttle.rate != rate:
+            self._throttle = TokenBucket(rate)
+        return self._throttle
+
+    def _open_store(self, game_dir: str) -> Optional[BlobStore]:
+        """Open the deduplicated store for a game directory if enabled."""
+        if not self.config.get("dedup_store", False):
+            return None
+        store = self._store_for(game_dir)
+        if store is None:
+            Logger.error(
+                f"No writable blob store location on the volume of {game_dir}; "
+                "set dedup_store_dir to a folder on that volume"
+            )
+        return store
+
+    def _store_for(self, game_dir: str) -> Optional[BlobStore]:
+        """The blob store serving a game directory: configured, Steam library or cache."""
+        return BlobStore.for_path(
+            game_dir, self.config.get("dedup_store_dir"), self.cache_dir
+        )
+
+    def _add_recent_game(
+        self,
+        game_name: str,
+        game_path: str,
+        exe_path: str,
+        bepinex_source: Optional[str] = None,
+        profile: Optional[str] = None,
+        manifest: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Add a game to recent games list. With bepinex_source, the entry also
+        records the profile and a compact manifest of the install so the next
+        reinstall can sync only what changed (see sync_recent_game). The
+        manifest lives in the cache directory; the entry keeps its file name.
+        """
+        # Older configs stored the manifest itself; only file names are cached
+        previous = {
+            g["manifest"] for g in self.recent_games if isinstance(g.get("manifest"), str)
+        }
+
         # Remove if already exists
         self.recent_games = [g for g in self.recent_games if g.get("name") != game_name]
 
+        entry = {
+            "name": game_name,
+            "path": game_path,
+            "exe": exe_path,
+            "timestamp": datetime.datetime.now().isoformat(),
+        }
+        if bepinex_source:
+            if manifest is None:
+                manifest = self._recent_manifest(
+                    bepinex_source, os.path.dirname(exe_path)
+                )
+            name = self._recent_manifest_name(exe_path)
+            self._save_cache(
+                name,
+                {"files": manifest["files"].to_json(), "doorstop": manifest["doorstop"]},
+            )
+            entry.update(bepinex=bepinex_source, profile=profile, manifest=name)
+
         # Add to the beginning of the list
-        self.recent_games.insert(
-            0,
-            {
-                "name": game_name,
-                "path": game_path,
-                "exe": exe_path,
-                "timestamp": datetime.datetime.now().isoformat(),
-            },
-        )
+        self.recent_games.insert(0, entry)
 
         # Limit to max_recent_games
         max_games = self.config.get("max_recent_games", 10)
         self.recent_games = self.recent_games[:max_games]
 
+        # Drop cached manifests no entry refers to any more
+        kept = {
+            g["manifest"] for g in self.recent_games if isinstance(g.get("manifest"), str)
+        }
+        for name in previous - kept:
+            with contextlib.suppress(OSError):
+                os.remove(os.path.join(self.cache_dir, name))
+
         # Update config
         self.config["recent_games"] = self.recent_games
         self._save_config()
 
+    @staticmethod
+    def _recent_manifest_name(exe_path: str) -> str:
+        """Cache file name holding the recent-install manifest of a game."""
+        digest = hashlib.sha1(os.path.abspath(exe_path).encode("utf-8")).hexdigest()
+        return f"recent-{digest[:16]}.json"
+
     def _find_thunderstore_path(self) -> Optional[str]:
         """Find the Thunderstore Mod Manager data folder path."""
         for path in self.base_paths:
@@ -231,12 +2212,20 @@ class ThunderModInstaller:
         # If no predefined paths work, try to search for it
         if platform.system() == "Windows":
             appdata = os.path.expanduser("~/AppData/Roaming")
-            for root, dirs, _ in os.walk(appdata):
-                for dir_name in dirs:
-                    if "thunderstore" in dir_name.lower():
-                        possible_path = os.path.join(root, dir_name, "DataFolder")
-                        if os.path.exists(possible_path):
-                            return possible_path
+            with self._cancellable() as token:
+                try:
+                    for root, dirs, _ in self.fs.walk(appdata):
+                        token.check()
+                        for dir_name in dirs:
+                            if "thunderstore" in dir_name.lower():
+                                possible_path = os.path.join(root, dir_name, "DataFolder")
+                                if self.fs.exists(possible_path):
+                                    return possible_path
+                        # Manager data sits near the top of Roaming
+                        if os.path.relpath(root, appdata).count(os.sep) >= 2:
+                            dirs[:] = []
+                except OperationCancelled:
+                    console.print("[warning]Thunderstore search canceled.[/warning]")
 
         return None
 
@@ -269,16 +2258,9 @@ class ThunderModInstaller:
             return []
 
         # List all game directories in Thunderstore path
-        game_dirs = []
         try:
-            with yaspin(
-                Spinners.dots, text=f"Searching for game '{game_name}'..."
-            ) as sp:
-                entries = os.listdir(self.thunderstore_path)
-                for entry in entries:
-                    full_path = os.path.join(self.thunderstore_path, entry)
-                    if os.path.isdir(full_path):
-                        game_dirs.append((entry, full_path))
+            with spinner(Spinners.dots, f"Searching for game '{game_name}'...") as sp:
+                game_dirs = self.list_game_directories()
                 sp.ok("✓")
         except Exception as e:
             Logger.error(f"Error listing Thunderstore directories: {e}")
@@ -286,49 +2268,514 @@ class ThunderModInstaller:
 
         # Calculate similarity scores with the provided game name
         matches = []
+        matcher = difflib.SequenceMatcher(None, b=game_name.lower())
         for dir_name, dir_path in game_dirs:
-            similarity = difflib.SequenceMatcher(
-                None, dir_name.lower(), game_name.lower()
-            ).ratio()
-            Logger.debug(f"Directory: {dir_name}, Similarity: {similarity}")
+            matcher.set_seq1(dir_name.lower())
+            similarity = matcher.ratio()
+            debug_event("game_match", dir=dir_name, similarity=similarity)
             matches.append((dir_path, similarity))
 
         # Sort by similarity score, highest first
         return sorted(matches, key=lambda x: x[1], reverse=True)
 
-    def find_bepinex_folder(self, game_dir: str) -> Optional[str]:
+    def list_game_directories(self) -> List[Tuple[str, str]]:
+        """
+        List (name, path) of game directories in the Thunderstore data folder.
+        The listing is cached until the data folder's mtime changes.
+        """
+        mtime = self.fs.stat(self.thunderstore_path).st_mtime_ns
+        if self._game_index_mtime != mtime:
+            game_dirs = []
+            with self.fs.scandir(self.thunderstore_path) as it:
+                for entry in it:
+                    if entry.is_dir():
+                        game_dirs.append((entry.name, entry.path))
+            self._game_index = sorted(game_dirs)
+            self._game_index_mtime = mtime
+        return self._game_index
+
+    def build_hash_manifest(self, root: str) -> Dict[str, str]:
+        """
+        Hash every file of the copy plan under root.
+        Returns {relative_path: sha256}; unchanged files reuse cached digests.
+        """
+        manifest = {}
+        for rel_dir, files in scan_copy_plan(
+            root, self.path_filter, cancel=self.cancel_token, fs=self.fs
+        ):
+            for name, _ in files:
+                rel_path = f"{rel_dir}/{name}" if rel_dir else name
+                manifest[rel_path] = self._file_digest(os.path.join(root, rel_path))
+        return manifest
+
+    def _file_digest(self, path: str) -> str:
+        """Hash a file, reusing the cached digest while its size and mtime match."""
+        st = self.fs.stat(path)
+        cached = self._hash_cache.get(path)
+        if cached and cached[0] == st.st_size and cached[1] == st.st_mtime_ns:
+            return cached[2]
+        digest = hash_file(path, cancel=self.cancel_token, fs=self.fs)
+        self._hash_cache[path] = (st.st_size, st.st_mtime_ns, digest)
+        return digest
+
+    def verify_install(self, bepinex_source: str, game_dir: str) -> Dict[str, Any]:
+        """Compare an installed BepInEx folder against its source."""
+        target = os.path.join(game_dir, "BepInEx")
+        with self._cancellable() as token:
+            try:
+                expected = self.build_hash_manifest(bepinex_source)
+                actual = (
+                    self.build_hash_manifest(target) if self.fs.isdir(target) else {}
+                )
+            except OperationCancelled:
+                return {"ok": False, "cancelled": True, "error": token.reason}
+
+        missing = sorted(set(expected) - set(actual))
+        extra = sorted(set(actual) - set(expected))
+        mismatched = sorted(
+            path for path in expected if path in actual and expected[path] != actual[path]
+        )
+        return {
+            "ok": not (missing or mismatched),
+            "checked": len(expected),
+            "missing": missing,
+            "mismatched": mismatched,
+            "extra": extra,
+        }
+
+    def _profile_signature(self, bepinex_path: str) -> List[int]:
+        """Cheap change detector: mtimes of the BepInEx folder and its main subfolders."""
+        signature = []
+        for sub in ("", "plugins", "patchers", "core", "config"):
+            try:
+                signature.append(self.fs.stat(os.path.join(bepinex_path, sub)).st_mtime_ns)
+            except OSError:
+                signature.append(0)
+        return signature
+
+    def _measure_profile(self, bepinex_path: str) -> Dict[str, int]:
+        """Walk a profile's BepInEx folder once to count files, bytes and plugins."""
+        file_count = total_bytes = 0
+        for _, files in scan_copy_plan(bepinex_path, self.path_filter, fs=self.fs):
+            file_count += len(files)
+            total_bytes += sum(size for _, size in files)
+
+        plugin_count = 0
+        plugins_dir = os.path.join(bepinex_path, "plugins")
+        if self.fs.isdir(plugins_dir):
+            with self.fs.scandir(plugins_dir) as it:
+                for entry in it:
+                    if entry.is_dir() or entry.name.lower().endswith(".dll"):
+                        plugin_count += 1
+
+        return {
+            "file_count": file_count,
+            "total_bytes": total_bytes,
+            "plugin_count": plugin_count,
+        }
+
+    def list_profiles(self, game_dir: str, measure: bool = False) -> List[Dict[str, Any]]:
+        """
+        List the profiles of a game from the catalogue.
+        Profiles whose signature changed are re-measured in the background
+        (or right away with measure=True); others are returned from cache.
+        Default comes first, then most recently modified.
+        """
+        cached = self.profile_catalogue.get(game_dir, {})
+        records = {}
+        stale = []
+
+        profiles_dir = os.path.join(game_dir, "profiles")
+        if self.fs.isdir(profiles_dir):
+            with self.fs.scandir(profiles_dir) as it:
+                profile_dirs = [entry.path for entry in it if entry.is_dir()]
+
+            def signature_of(profile_dir):
+                bepinex_path = os.path.join(profile_dir, "BepInEx")
+                if not self.fs.isdir(bepinex_path):
+                    return None
+                return self._profile_signature(bepinex_path)
+
+            # Each profile costs a few stats; on slow mounts do them side by side
+            signatures, timed_out = scan_parallel(
+                profile_dirs,
+                signature_of,
+                self.config.get("scan_workers", 8),
+                self.config.get("scan_timeout", 10),
+            )
+            for profile_dir in timed_out:
+                # Keep what we knew about a profile that did not answer in time
+                name = os.path.basename(profile_dir)
+                if name in cached:
+                    records[name] = cached[name]
+
+            for profile_dir, signature in signatures.items():
+                if signature is None:
+                    continue
+                name = os.path.basename(profile_dir)
+                bepinex_path = os.path.join(profile_dir, "BepInEx")
+                record = cached.get(name)
+                if record is None or record.get("signature") != signature:
+                    record = {
+                        "name": name,
+                        "bepinex_path": bepinex_path,
+                        "signature": signature,
+                        "last_modified": max(signature) / 1e9,
+                        "file_count": None,
+                        "total_bytes": None,
+                        "plugin_count": None,
+                    }
+                if record["file_count"] is None:
+                    stale.append(name)
+                records[name] = record
+
+            if measure and stale:
+                measured, _ = scan_parallel(
+                    [records[name]["bepinex_path"] for name in stale],
+                    self._measure_profile,
+                    self.config.get("scan_workers", 8),
+                )
+                for name in stale:
+                    records[name].update(measured.get(records[name]["bepinex_path"], {}))
+
+        with self._catalogue_lock:
+            self.profile_catalogue[game_dir] = records
+        if measure:
+            self._save_catalogue()
+        elif stale:
+            self._measure_in_background(game_dir)
+
+        return sorted(
+            records.values(),
+            key=lambda r: (r["name"] != "Default", -r["last_modified"]),
+        )
+
+    def _save_catalogue(self):
+        with self._catalogue_lock:
+            self._save_cache("profiles.json", self.profile_catalogue)
+
+    def _measure_in_background(self, game_dir: str):
+        """
+        Queue a game's catalogue entries for re-measuring. One daemon thread
+        measures the queued games in turn, so however many games go stale at
+        once, at most scan_workers walks run side by side.
+        """
+        with self._catalogue_lock:
+            if game_dir in self._measuring:
+                return
+            self._measuring.add(game_dir)
+            self._measure_queue.append(game_dir)
+            if self._measurer is None:
+                self._measurer = threading.Thread(
+                    target=self._measure_queued, name="thunderinex-measure", daemon=True
+                )
+                self._measurer.start()
+
+    def _measure_queued(self):
+        while True:
+            with self._catalogue_lock:
+                if not self._measure_queue:
+                    self._measurer = None
+                    return
+                game_dir = self._measure_queue.popleft()
+            try:
+                self.list_profiles(game_dir, measure=True)
+            except Exception as e:
+                Logger.error(f"Error measuring profiles for {game_dir}: {e}")
+            finally:
+                with self._catalogue_lock:
+                    self._measuring.discard(game_dir)
+
+    def refresh_profile_catalogue(self):
+        """Refresh the catalogue for every game in the background."""
+        if not self.thunderstore_path:
+            return
+
+        def worker():
+            # One game at a time; each game's profiles are still checked side
+            # by side, and stale ones go to the shared measuring queue
+            for _, game_dir in self.list_game_directories():
+                try:
+                    self.list_profiles(game_dir)
+                except Exception as e:
+                    Logger.error(f"Error refreshing profile catalogue for {game_dir}: {e}")
+
+        threading.Thread(target=worker, name="thunderinex-catalogue", daemon=True).start()
+
+    def profile_name(self, game_dir: str, bepinex_path: str) -> str:
+        """Name of the catalogued profile a BepInEx folder belongs to, or ""."""
+        for record in self.list_profiles(game_dir):
+            if os.path.normcase(record["bepinex_path"]) == os.path.normcase(bepinex_path):
+                return record["name"]
+        return ""
+
+    def select_profile(self, game_dir: str) -> Optional[str]:
+        """
+        Let the user pick a profile when a game has several.
+        Returns the profile name, or None if canceled.
+        """
+        profiles = self.list_profiles(game_dir)
+        if len(profiles) <= 1:
+            return profiles[0]["name"] if profiles else ""
+
+        def describe(record):
+            if record["file_count"] is None:
+                stats = "scanning..."
+            else:
+                stats = (
+                    f"{record['plugin_count']} plugins, {record['file_count']} files, "
+                    f"{record['total_bytes'] / (1024 * 1024):.1f} MB"
+                )
+            modified = datetime.datetime.fromtimestamp(record["last_modified"])
+            return f"{record['name']} ({stats}, modified {modified:%Y-%m-%d %H:%M})"
+
+        return questionary.select(
+            "Multiple profiles found. Please select one:",
+            choices=[{"name": describe(r), "value": r["name"]} for r in profiles],
+            style=questionary_style,
+        ).ask()
+
+    def _plugin_signature(self, plugin_dir: str) -> List[int]:
+        signature = [self.fs.stat(plugin_dir).st_mtime_ns]
+        try:
+            signature.append(
+                self.fs.stat(os.path.join(plugin_dir, "manifest.json")).st_mtime_ns
+            )
+        except OSError:
+            signature.append(0)
+        return signature
+
+    def _read_plugin(self, plugin_dir: str, signature: List[int]) -> Dict[str, Any]:
+        """Parse a plugin's manifest and hash its contents."""
+        folder = os.path.basename(plugin_dir)
+        manifest = {}
+        if signature[1]:
+            try:
+                with self.fs.open(os.path.join(plugin_dir, "manifest.json"), "rb") as f:
+                    manifest = json.loads(f.read().decode("utf-8-sig"))
+            except (OSError, ValueError) as e:
+                Logger.debug(f"Unreadable manifest in {plugin_dir}: {e}")
+            if not isinstance(manifest, dict):
+                Logger.debug(f"Ignoring manifest in {plugin_dir}: not a JSON object")
+                manifest = {}
+
+        def field(key):
+            # Hand-edited manifests may hold numbers, lists or nulls
+            value = manifest.get(key)
+            return value if isinstance(value, str) and value else None
+
+        # Thunderstore folders are named <Author>-<Name>
+        author, _, name = folder.partition("-")
+        content = hashlib.sha256()
+        size = file_count = 0
+        for rel_path, digest in sorted(self.build_hash_manifest(plugin_dir).items()):
+            content.update(f"{rel_path}\0{digest}\n".encode("utf-8"))
+            size += self._hash_cache[os.path.join(plugin_dir, rel_path)][0]
+            file_count += 1
+
+        return {
+            "name": field("name") or name or folder,
+            "version": field("version_number") or field("version"),
+            "author": field("author") or (author if name else None),
+            "folder": folder,
+            "size": size,
+            "file_count": file_count,
+            "content_hash": content.hexdigest(),
+            "signature": signature,
+        }
+
+    def build_plugin_index(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Index every plugin folder across all games and profiles.
+        Folders whose mtimes are unchanged reuse their cached record; the rest
+        are parsed and hashed in parallel.
+        """
+        if self._plugin_index is None:
+            self._plugin_index = self._load_cache("plugins.json")
+        if not self.thunderstore_path:
+            return self._plugin_index
+
+        with self._cancellable() as token:
+            try:
+                return self._index_plugins(token)
+            except OperationCancelled:
+                console.print("[warning]Plugin indexing canceled.[/warning]")
+                return self._plugin_index
+
+    def _index_plugins(self, token: CancelToken) -> Dict[str, Dict[str, Any]]:
+        """Rebuild the plugin index, checking token between folders."""
+        cached = self._plugin_index
+        index = {}
+        pending = []
+        for game_name, game_dir in self.list_game_directories():
+            token.check()
+            for profile in self.list_profiles(game_dir):
+                plugins_dir = os.path.join(profile["bepinex_path"], "plugins")
+                if not self.fs.isdir(plugins_dir):
+                    continue
+                with self.fs.scandir(plugins_dir) as it:
+                    for entry in it:
+                        if not entry.is_dir():
+                            continue
+                        token.check()
+                        signature = self._plugin_signature(entry.path)
+                        record = cached.get(entry.path)
+                        if record is not None and record.get("signature") == signature:
+                            index[entry.path] = record
+                        else:
+                            pending.append((entry.path, signature, game_name, profile["name"]))
+
+        if pending:
+            workers = self.config.get("copy_workers", 4) * 2
+            with ThreadPoolExecutor(workers) as executor:
+                futures = {
+                    executor.submit(self._read_plugin, path, signature): (path, game, profile)
+                    for path, signature, game, profile in pending
+                }
+                try:
+                    for future, (path, game, profile) in futures.items():
+                        try:
+                            record = future.result()
+                        except (OSError, ValueError, AttributeError) as e:
+                            Logger.error(f"Error indexing plugin {path}: {e}")
+                            continue
+                        record.update(game=game, profile=profile)
+                        index[path] = record
+                except OperationCancelled:
+                    # Running workers stop at their next hash chunk
+                    for future in futures:
+                        future.cancel()
+                    raise
+
+        if pending or len(index) != len(cached):
+            self._save_cache("plugins.json", index)
+        self._plugin_index = index
+        return index
+
+    def find_plugins(
+        self, name: str, version: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Return indexed plugins matching a name (or Author-Name folder) and version."""
+        name = name.lower()
+        return sorted(
+            (
+                dict(record, path=path)
+                for path, record in self.build_plugin_index().items()
+                if name in (str(record["name"]).lower(), record["folder"].lower())
+                and (version is None or record["version"] == version)
+            ),
+            key=lambda r: (r["game"], r["profile"]),
+        )
+
+    def largest_plugins(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """Return the largest indexed plugins."""
+        records = [
+            dict(record, path=path) for path, record in self.build_plugin_index().items()
+        ]
+        return sorted(records, key=lambda r: r["size"], reverse=True)[:limit]
+
+    def display_plugins(self, records: List[Dict[str, Any]], title: str):
+        """Display plugin index records in a rich table."""
+        if not records:
+            console.print("[info]No matching plugins.[/info]")
+            return
+
+        table = Table(title=title, box=box.ROUNDED)
+        table.add_column("Plugin", style="cyan")
+        table.add_column("Version", style="green")
+        table.add_column("Author")
+        table.add_column("Game", style="blue")
+        table.add_column("Profile", style="magenta")
+        table.add_column("Size", justify="right")
+
+        for record in records:
+            table.add_row(
+                str(record["name"]),
+                str(record["version"] or "?"),
+                str(record["author"] or "?"),
+                record["game"],
+                record["profile"],
+                f"{record['size'] / (1024 * 1024):.1f} MB",
+            )
+
+        console.print(table)
+
+    def find_bepinex_folder(
+        self, game_dir: str, profile: Optional[str] = None
+    ) -> Optional[str]:
         """Find BepInEx folder within the game directory structure."""
         bepinex_paths = []
 
-        with yaspin(Spinners.bouncingBar, text="Searching for BepInEx folder...") as sp:
+        with spinner(Spinners.bouncingBar, "Searching for BepInEx folder...") as sp:
+            # A named profile comes straight from the catalogue
+            if profile:
+                for record in self.list_profiles(game_dir):
+                    if record["name"].lower() == profile.lower():
+                        sp.ok("✓")
+                        return record["bepinex_path"]
+                sp.fail("✗")
+                return None
+
             # Expected path pattern: <game_dir>/profiles/Default/BepInEx
             default_path = os.path.join(game_dir, "profiles", "Default", "BepInEx")
-            if os.path.exists(default_path) and os.path.isdir(default_path):
-                Logger.debug(f"Found BepInEx at expected path: {default_path}")
+            if self.fs.isdir(default_path):
+                debug_event("bepinex_found", path=default_path, via="default")
                 sp.ok("✓")
                 return default_path
 
-            # If not in the expected location, search within the game_dir
-            Logger.debug(
-                f"BepInEx not found at expected path, searching recursively..."
-            )
-
-            for root, dirs, _ in os.walk(game_dir):
-                # Limit search depth to avoid excessive searching
-                rel_path = os.path.relpath(root, game_dir)
-                if rel_path.count(os.sep) > self.search_depth:
-                    continue
+            # Otherwise use the most recently modified catalogued profile
+            profiles = self.list_profiles(game_dir)
+            if profiles:
+                debug_event("bepinex_found", path=profiles[0]["bepinex_path"], via="profile")
+                sp.ok("✓")
+                return profiles[0]["bepinex_path"]
 
-                for dir_name in dirs:
-                    if (
-                        difflib.SequenceMatcher(
-                            None, dir_name.lower(), "bepinex"
-                        ).ratio()
-                        > 0.8
-                    ):
-                        bepinex_path = os.path.join(root, dir_name)
-                        Logger.debug(f"Found potential BepInEx folder: {bepinex_path}")
-                        bepinex_paths.append(bepinex_path)
+            # If not in the expected location, search within the game_dir
+            debug_event("bepinex_search", root=game_dir, depth=self.search_depth)
+
+            def search(top):
+                found = []
+                for root, dirs, _ in self.fs.walk(top):
+                    token.check()
+                    for dir_name in dirs:
+                        if (
+                            difflib.SequenceMatcher(
+                                None, dir_name.lower(), "bepinex"
+                            ).ratio()
+                            > 0.8
+                        ):
+                            bepinex_path = os.path.join(root, dir_name)
+                            debug_event("bepinex_candidate", path=bepinex_path)
+                            found.append(bepinex_path)
+
+                    # Limit search depth to avoid excessive searching
+                    if os.path.relpath(root, game_dir).count(os.sep) >= self.search_depth:
+                        dirs[:] = []
+                return found
+
+            # Search each top-level folder on its own worker, in walk order
+            with self.fs.scandir(game_dir) as it:
+                tops = sorted(entry.path for entry in it if entry.is_dir())
+            for top in tops:
+                if difflib.SequenceMatcher(
+                    None, os.path.basename(top).lower(), "bepinex"
+                ).ratio() > 0.8:
+                    bepinex_paths.append(top)
+            with self._cancellable() as token:
+                try:
+                    found, _ = scan_parallel(
+                        tops,
+                        search,
+                        self.config.get("scan_workers", 8),
+                        self.config.get("scan_timeout", 10),
+                        token,
+                    )
+                except OperationCancelled:
+                    sp.fail("✗")
+                    console.print("[warning]BepInEx search canceled.[/warning]")
+                    return None
+            for top in tops:
+                bepinex_paths.extend(found.get(top, []))
 
             if bepinex_paths:
                 sp.ok("✓")
@@ -340,122 +2787,1607 @@ class ThunderModInstaller:
             return bepinex_paths[0]
         return None
 
+    def _confirm_replace(self, target_bepinex: str) -> bool:
+        """
+        Check whether an existing BepInEx folder may be replaced.
+        Returns False if the user cancels.
+        """
+        if not self.fs.exists(target_bepinex):
+            return True
+
+        console.print(
+            "[warning]BepInEx folder already exists in the target directory.[/warning]"
+        )
+
+        if not self.config.get("auto_backup", True) and self.interactive:
+            overwrite = Confirm.ask("Overwrite existing BepInEx folder?")
+            if not overwrite:
+                console.print("[info]Installation canceled.[/info]")
+                return False
+        return True
+
+    def _move_aside(self, target_bepinex: str, bus: ProgressBus) -> Optional[str]:
+        """
+        Move an existing BepInEx folder out of the way so a new one can be
+        installed immediately. Once the install commits it is backed up and
+        deleted in the background; if it fails it is moved back.
+        """
+        if not self.fs.exists(target_bepinex):
+            return None
+        bus.start_phase("move_aside", "Moving old BepInEx folder aside")
+        # _move_to_trash keeps sweeps away until it is retired or rolled back
+        aside = self._move_to_trash(target_bepinex)
+        bus.advance()
+        return aside
+
+    @contextlib.contextmanager
+    def _progress_session(self):
+        """Run a block with a ProgressBus drawn by a renderer thread."""
+        bus = ProgressBus()
+        if debug_log is not None:
+            bus.subscribe(lambda event: debug_log.record("progress", event))
+        renderer = make_renderer(bus)
+        renderer.start()
+        try:
+            yield bus
+            bus.end_phase()
+        except OperationCancelled:
+            bus.end_phase("cancelled")
+            raise
+        except BaseException:
+            bus.end_phase("failed")
+            raise
+        finally:
+            renderer.stop()
+            if debug_log is not None:
+                debug_log.flush()
+
+    @contextlib.contextmanager
+    def _cancellable(self):
+        """
+        Run a long operation under a CancelToken, shared by nested calls.
+        In the main thread the first Ctrl+C cancels it so every worker stops
+        at its next checkpoint and the operation can clean up; a second
+        Ctrl+C interrupts immediately.
+        """
+        if self.cancel_token is not None:
+            yield self.cancel_token
+            return
+
+        token = self.cancel_token = CancelToken()
+        previous = None
+        if threading.current_thread() is threading.main_thread():
+
+            def on_interrupt(signum, frame):
+                if token.cancelled:
+                    raise KeyboardInterrupt
+                token.cancel("Canceled by user")
+                console.print(
+                    "\n[warning]Canceling... press Ctrl+C again to force.[/warning]"
+                )
+
+            previous = signal.signal(signal.SIGINT, on_interrupt)
+        try:
+            yield token
+        finally:
+            self.cancel_token = None
+            if previous is not None:
+                signal.signal(signal.SIGINT, previous)
+
+    PARTIAL_SUFFIX = ".thunderinex-part"
+
+    def _copy_replace(
+        self,
+        copier: FileCopier,
+        source: str,
+        destination: str,
+        size: int,
+        rel_path: Optional[str] = None,
+    ) -> str:
+        """
+        Copy to a temporary name beside destination, then swap it in, so a
+        cancelled or failed copy never leaves a torn file behind.
+        """
+        partial = destination + self.PARTIAL_SUFFIX
+        try:
+            strategy = copier.copy(source, partial, size, rel_path)
+            self.fs.replace(partial, destination)
+        except BaseException:
+            if self.fs.lexists(partial):
+                self.fs.unlink(partial)
+            raise
+        return strategy
+
+    def _roll_back(self, target_bepinex: str, aside: Optional[str]) -> bool:
+        """
+        Undo a partial install: the half-copied folder is trashed and the
+        moved-aside original renamed back. Returns True if the original was
+        restored.
+        """
+        if self.fs.lexists(target_bepinex):
+            self._delete_in_background(self._move_to_trash(target_bepinex))
+        if aside is None:
+            return False
+        self.fs.replace(aside, target_bepinex)
+        with self._catalogue_lock:
+            self._deleting.discard(aside)
+        return True
+
+    def _after_commit(self, bus: ProgressBus, warnings: List[str], what: str, step):
+        """
+        Run a step that follows the commit of an install. The new files are
+        already in place, so a failure is reported as a warning instead of
+        failing (and rolling back) the install. Returns the step's result.
+        """
+        try:
+            return step()
+        except Exception as e:
+            Logger.error(f"Error {what}: {e}")
+            bus.message(f"Installed, but {what} failed: {e}", "warning")
+            warnings.append(f"{what}: {e}")
+            return None
+
+    def _retire(
+        self, aside: str, game_dir: str, on_written=None
+    ) -> Optional[str]:
+        """
+        Hand a moved-aside BepInEx folder to the background worker, which
+        writes a compressed snapshot of it (when auto_backup is on) and then
+        deletes it. Returns the snapshot path being written; on_written is
+        called with it once the snapshot is complete. If the snapshot fails
+        the folder is kept in the backups folder instead of being deleted.
+        """
+        if not self.config.get("auto_backup", True):
+            self._delete_in_background(aside)
+            return None
+
+        backup_dir = os.path.join(game_dir, ".thunderinex_backups")
+        self.fs.makedirs(backup_dir, exist_ok=True)
+        snapshot = os.path.join(
+            backup_dir,
+            f"BepInEx_{datetime.datetime.now():%Y%m%d-%H%M%S}."
+            f"{self.config.get('backup_format', 'zip')}",
+        )
+        suffix = 1
+        while self.fs.exists(snapshot):
+            root, ext = os.path.splitext(snapshot)
+            snapshot = f"{root.rsplit('~', 1)[0]}~{suffix}{ext}"
+            suffix += 1
+        # Claim the name now so back-to-back snapshots don't collide
+        self.fs.open(snapshot, "wb").close()
+
+        if self._backup_pool is None:
+            self._backup_pool = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="thunderinex-backup"
+            )
+
+        def write_snapshot():
+            entries = []
+            for rel_dir, files in scan_copy_plan(aside, self.path_filter, fs=self.fs):
+                for name, size in files:
+                    rel_path = f"{rel_dir}/{name}" if rel_dir else name
+                    source = os.path.join(aside, rel_path)
+                    mtime = self.fs.stat(source).st_mtime_ns
+                    entries.append((f"BepInEx/{rel_path}", source, size, mtime, None))
+            self._write_archive(snapshot, entries, {"game": os.path.basename(game_dir)})
+
+        def keep_aside(error):
+            # The tree is the only copy of the old install: move it out of
+            # the trash so no sweep deletes it
+            kept = os.path.join(backup_dir, os.path.basename(snapshot).split(".", 1)[0])
+            suffix = 1
+            while self.fs.lexists(kept):
+                kept = f"{kept.rsplit('~', 1)[0]}~{suffix}"
+                suffix += 1
+            try:
+                if self.fs.lexists(snapshot):
+                    self.fs.unlink(snapshot)
+                self.fs.rename(aside, kept)
+            except OSError as e:
+                Logger.error(f"Error keeping previous BepInEx folder {aside}: {e}")
+                kept = aside
+            else:
+                with self._catalogue_lock:
+                    self._deleting.discard(aside)
+            Logger.error(f"Error writing backup snapshot {snapshot}: {error}")
+            console.print(
+                f"[warning]Could not write backup snapshot: {error}. The previous "
+                f"BepInEx folder was kept at [path]{kept}[/path].[/warning]"
+            )
+            debug_event("snapshot_failed", snapshot=snapshot, kept=kept, error=str(error))
+
+        def job():
+            try:
+                write_snapshot()
+            except Exception as e:
+                keep_aside(e)
+                return
+            Logger.debug(f"Wrote backup snapshot: {snapshot}")
+            if on_written is not None:
+                on_written(snapshot)
+            self._delete_in_background(aside).join()
+            try:
+                self._prune_snapshots(backup_dir)
+            except OSError as e:
+                Logger.error(f"Error pruning backup snapshots in {backup_dir}: {e}")
+
+        self._backup_pool.submit(job)
+        return snapshot
+
+    def wait_for_backups(self):
+        """Block until snapshots still being written in the background finish."""
+        if self._backup_pool is not None:
+            with spinner(Spinners.dots, "Waiting for background backups...") as sp:
+                self._backup_pool.shutdown(wait=True)
+                self._backup_pool = None
+                sp.ok("✓")
+
+    def _prune_snapshots(self, backup_dir: str):
+        """Keep only the newest max_backups snapshots."""
+        keep = self.config.get("max_backups", 5)
+        snapshots = self.list_snapshots(os.path.dirname(backup_dir))[::-1]
+        for old in snapshots[keep:]:
+            self.fs.unlink(old)
+
+    def list_snapshots(self, game_dir: str) -> List[str]:
+        """List backup snapshots for a game directory, oldest first."""
+        backup_dir = os.path.join(game_dir, ".thunderinex_backups")
+        if not self.fs.isdir(backup_dir):
+            return []
+        snapshots = []
+        for name in self.fs.listdir(backup_dir):
+            path = os.path.join(backup_dir, name)
+            # Folders kept after a failed snapshot are not restorable packs
+            if self.fs.isdir(path):
+                continue
+            try:
+                snapshots.append((self.fs.stat(path).st_mtime, path))
+            except OSError:
+                continue  # Pruned by a background snapshot meanwhile
+        return [path for _, path in sorted(snapshots)]
+
     def install_bepinex(
         self, bepinex_source: str, game_exe_path: str, game_name: str
     ) -> bool:
-        """Copy BepInEx folder to the game directory."""
+        """
+        Copy BepInEx folder to the game directory. The install is all or
+        nothing: if it fails or is canceled, the previous folder is put back.
+        """
         # Get the game directory from the exe path
         game_dir = os.path.dirname(game_exe_path)
         target_bepinex = os.path.join(game_dir, "BepInEx")
+        result = self.last_result = {
+            "operation": "install",
+            "ok": False,
+            "game": game_name,
+            "game_dir": game_dir,
+            "bepinex_source": bepinex_source,
+            "backup": None,
+        }
 
         console.print(
             f"Installing BepInEx from [path]{bepinex_source}[/path] to [path]{game_dir}[/path]"
         )
 
+        if not self._confirm_replace(target_bepinex):
+            result["error"] = "canceled"
+            return False
+
+        bus = None
+        pipeline = None
+        transaction = InstallTransaction(self, game_dir)
         try:
-            # Check if BepInEx already exists in the target directory
-            if os.path.exists(target_bepinex):
-                console.print(
-                    "[warning]BepInEx folder already exists in the target directory.[/warning]"
+            with self._cancellable(), self._progress_session() as bus:
+                # Move an existing BepInEx folder aside; it is only retired
+                # once the new one is complete
+                transaction.begin(bus)
+
+                # Shared files are hardlinked from a per-volume store when enabled
+                store = self._open_store(game_dir)
+                copier = self._build_copier(
+                    store=store,
+                    store_filter=PathFilter(include=self.config.get("dedup_patterns", [])),
                 )
 
-                if not self.config.get("auto_backup", True):
-                    overwrite = Confirm.ask("Overwrite existing BepInEx folder?")
-                    if not overwrite:
-                        console.print("[info]Installation canceled.[/info]")
-                        return False
-
-                # Backup the existing BepInEx folder
-                backup_path = f"{target_bepinex}_backup_{int(time.time())}"
-                with yaspin(
-                    Spinners.bouncingBall,
-                    text="Creating backup of existing BepInEx folder...",
-                ) as sp:
-                    shutil.copytree(target_bepinex, backup_path)
-                    sp.ok("✓")
-                console.print(f"Created backup at [path]{backup_path}[/path]")
-
-                # Remove the existing folder
-                with yaspin(
-                    Spinners.clock, text="Removing old BepInEx folder..."
-                ) as sp:
-                    shutil.rmtree(target_bepinex)
-                    sp.ok("✓")
+                # The total is only known once the tree has been scanned
+                bus.start_phase("copy", "Copying BepInEx folder")
 
-            # Copy BepInEx folder to game directory with progress bar
-            with Progress(
-                TextColumn("[progress.description]{task.description}"),
-                BarColumn(),
-                TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-                TimeRemainingColumn(),
-                console=console,
-            ) as progress:
-                task1 = progress.add_task("[cyan]Copying BepInEx folder...", total=100)
-
-                # Count files for progress calculation
-                total_files = sum(
-                    [len(files) for _, _, files in os.walk(bepinex_source)]
-                )
-                copied_files = 0
-
-                # Define a callback for updating progress
-                def copy_with_progress(src, dst):
-                    nonlocal copied_files
-                    shutil.copy2(src, dst)
-                    copied_files += 1
-                    progress.update(
-                        task1, completed=int(copied_files / total_files * 100)
+                def update_progress(pipeline):
+                    bus.update(
+                        pipeline.files_copied,
+                        pipeline.files_found if pipeline.scan_done else None,
+                        pipeline.bytes_copied,
                     )
 
-                # Custom copytree with progress
-                def custom_copytree(src, dst):
-                    os.makedirs(dst, exist_ok=True)
-                    for item in os.listdir(src):
-                        s = os.path.join(src, item)
-                        d = os.path.join(dst, item)
-                        if os.path.isdir(s):
-                            custom_copytree(s, d)
-                        else:
-                            copy_with_progress(s, d)
-
-                custom_copytree(bepinex_source, target_bepinex)
-
-            # Copy doorstop files to game directory if they exist
-            doorstop_files = ["winhttp.dll", "doorstop_config.ini"]
-            doorstop_copied = False
+                pipeline = self._build_pipeline(
+                    bepinex_source,
+                    target_bepinex,
+                    on_progress=update_progress,
+                    copier=copier,
+                )
+                manifest = pipeline.run()
+                debug_event("copy_scheduler", **pipeline.stats)
+                result.update(
+                    scheduler=pipeline.stats,
+                    strategies=dict(pipeline.strategies),
+                    files_copied=pipeline.files_copied,
+                    bytes_copied=pipeline.bytes_copied,
+                    files_skipped=pipeline.skipped["files"],
+                    bytes_skipped=pipeline.skipped["bytes"],
+                    dirs_skipped=pipeline.skipped["dirs"],
+                )
 
-            with yaspin(
-                Spinners.simpleDotsScrolling, text="Copying doorstop files..."
-            ) as sp:
+                # Stage doorstop files next to the game; they replace the
+                # old ones only when the install commits
+                bus.start_phase("doorstop", "Copying doorstop files")
+                doorstop_files = ["winhttp.dll", "doorstop_config.ini"]
                 for doorstop_file in doorstop_files:
                     doorstop_source = os.path.join(
                         os.path.dirname(bepinex_source), doorstop_file
                     )
-                    if os.path.exists(doorstop_source):
-                        shutil.copy2(
-                            doorstop_source, os.path.join(game_dir, doorstop_file)
+                    if self.fs.exists(doorstop_source):
+                        size = self.fs.stat(doorstop_source).st_size
+                        partial = transaction.stage(os.path.join(game_dir, doorstop_file))
+                        strategy = copier.copy(
+                            doorstop_source, partial, size, doorstop_file
                         )
-                        doorstop_copied = True
-                        Logger.debug(f"Copied doorstop file: {doorstop_file}")
+                        result["strategies"][strategy] = (
+                            result["strategies"].get(strategy, 0) + 1
+                        )
+                        bus.advance(1, size)
+                        debug_event("doorstop_copied", file=doorstop_file)
 
-                if doorstop_copied:
-                    sp.ok("✓")
-                else:
-                    sp.text = "No doorstop files found"
-                    sp.ok("!")
+                if bus.done == 0:
+                    bus.message("No doorstop files found", "warning")
+
+                # Commit: nothing below checks for cancellation
+                bus.start_phase("finalize", "Recording install manifest")
+                transaction.commit()
+
+                # The new files are in place; later failures are only warnings
+                warnings = result["warnings"] = []
+                transaction.retire(
+                    bus, warnings, lambda path: result.__setitem__("backup", path)
+                )
 
+                def update_store():
+                    # Unused blobs are collected by the gc-store command
+                    store.save()
+                    if pipeline.strategies["hardlink"]:
+                        bus.message(
+                            f"Linked {pipeline.strategies['hardlink']} files from {store.root}"
+                        )
+
+                if store is not None:
+                    self._after_commit(bus, warnings, "updating the file store", update_store)
+
+                self._after_commit(
+                    bus,
+                    warnings,
+                    "recording the install manifest",
+                    lambda: self._write_install_manifest(
+                        game_dir,
+                        {
+                            "source": bepinex_source,
+                            "game": game_name,
+                            "timestamp": datetime.datetime.now().isoformat(),
+                            "files": manifest,
+                            "doorstop": [
+                                f
+                                for f in doorstop_files
+                                if self.fs.exists(os.path.join(game_dir, f))
+                            ],
+                        },
+                    ),
+                )
+                bus.advance()
+
+            result["ok"] = True
             console.print("\n[success]BepInEx installed successfully![/success]")
             return True
 
         except Exception as e:
+            cancelled = isinstance(e, OperationCancelled)
+            if transaction.active:
+                restored = transaction.roll_back("install")
+                result["rolled_back"] = restored is not None
+                result["restored_previous"] = bool(restored)
+            if pipeline is not None:
+                result.update(
+                    files_copied=pipeline.files_copied,
+                    bytes_copied=pipeline.bytes_copied,
+                )
+            if cancelled:
+                result.update(error="canceled", cancelled=True)
+                console.print(
+                    f"[warning]Installation canceled after copying "
+                    f"{result.get('files_copied', 0)} files; "
+                    + (
+                        "the previous BepInEx folder was restored."
+                        if result.get("restored_previous")
+                        else "the partial copy was removed."
+                    )
+                    + "[/warning]"
+                )
+                return False
+            result["error"] = str(e)
             Logger.error(f"Error installing BepInEx: {e}")
             console.print(f"[error]Error during installation: {e}[/error]")
             return False
+        finally:
+            if bus is not None:
+                result["phases"] = {
+                    name: round(duration, 3) for name, duration in bus.durations.items()
+                }
+
+    def benchmark_copy(
+        self,
+        source: str,
+        target_root: Optional[str] = None,
+        worker_counts: Optional[List[int]] = None,
+    ):
+        """
+        Time copy strategies on a real tree and print a comparison table,
+        followed by the configured strategy at each worker count (both
+        schedules) to show how far copying scales on this disk.
+        """
+        baseline = self._build_copier()
+        configured_workers = self.config.get("copy_workers", 4)
+        variants = [
+            (
+                "copy2 only",
+                self._build_copier(small_threshold=-1, large_threshold=2**62),
+                configured_workers,
+                None,
+            ),
+            ("configured", baseline, configured_workers, None),
+            ("mmap for large files", self._build_copier(use_mmap=True), configured_workers, None),
+            (
+                "4x large buffer",
+                self._build_copier(large_buffer_size=baseline.large_buffer_size * 4),
+                configured_workers,
+                None,
+            ),
+        ]
+        for workers in worker_counts or [1, 2, 4, 8]:
+            for schedule in ("size", "stream"):
+                variants.append(
+                    (f"{schedule} schedule", self._build_copier(), workers, schedule)
+                )
+
+        title = f"Copy benchmark: {source}"
+        if isinstance(self.fs, SimulatedFS):
+            title += f" (simulated {self.fs.profile or 'disk'})"
+        table = Table(title=title, box=box.ROUNDED)
+        table.add_column("Strategy", style="cyan")
+        table.add_column("Workers", justify="right")
+        table.add_column("Files", justify="right")
+        table.add_column("MB", justify="right")
+        table.add_column("Seconds", justify="right")
+        table.add_column("MB/s", justify="right", style="green")
+        table.add_column("Speedup", justify="right")
+        table.add_column("Util", justify="right")
+        table.add_column("small/medium/large", style="dim")
+
+        single_worker: Dict[str, float] = {}
+        for label, copier, workers, schedule in variants:
+            scratch = tempfile.mkdtemp(prefix="thunderinex_bench_", dir=target_root)
+            overrides = {"schedule": schedule} if schedule else {}
+            try:
+                pipeline = self._build_pipeline(
+                    source,
+                    os.path.join(scratch, "BepInEx"),
+                    workers=workers,
+                    hash_files=False,
+                    copier=copier,
+                    **overrides,
+                )
+                with spinner(Spinners.dots, f"Benchmarking {label}...") as sp:
+                    started = time.perf_counter()
+                    pipeline.run()
+                    elapsed = max(time.perf_counter() - started, 1e-6)
+                    sp.ok("✓")
+            finally:
+                shutil.rmtree(scratch, ignore_errors=True)
+
+            megabytes = pipeline.bytes_copied / (1024 * 1024)
+            speedup = ""
+            if schedule:
+                # Relative to the same schedule with one worker
+                if workers == 1:
+                    single_worker[schedule] = elapsed
+                if schedule in single_worker:
+                    speedup = f"{single_worker[schedule] / elapsed:.2f}x"
+            table.add_row(
+                label,
+                str(workers),
+                str(pipeline.files_copied),
+                f"{megabytes:.1f}",
+                f"{elapsed:.2f}",
+                f"{megabytes / elapsed:.1f}",
+                speedup,
+                f"{pipeline.stats.get('utilization', 0) * 100:.0f}%",
+                "/".join(
+                    str(pipeline.strategies[k]) for k in ("small", "medium", "large")
+                ),
+            )
+
+        console.print(table)
+
+    PACK_MANIFEST = "thunderinex_pack.json"
+
+    def export_pack(self, bepinex_source: str, pack_path: str, game_name: str) -> bool:
+        """
+        Stream a BepInEx folder and its doorstop files into one compressed
+        archive (.zip, .tar.gz/.tgz, .tar.bz2 or .tar.xz) with an embedded manifest.
+        """
+        doorstop_dir = os.path.dirname(bepinex_source)
+        entries = []  # (arcname, source_path, size, mtime_ns, sha256)
+        try:
+            with self._cancellable() as token, self._progress_session() as bus:
+                bus.start_phase("hash", "Hashing files")
+                for rel_path, digest in self.build_hash_manifest(bepinex_source).items():
+                    path = os.path.join(bepinex_source, rel_path)
+                    size, mtime, _ = self._hash_cache[path]
+                    entries.append((f"BepInEx/{rel_path}", path, size, mtime, digest))
+                    bus.advance(1, size)
+                for doorstop_file in ["winhttp.dll", "doorstop_config.ini"]:
+                    path = os.path.join(doorstop_dir, doorstop_file)
+                    if self.fs.exists(path):
+                        digest = self._file_digest(path)
+                        size, mtime, _ = self._hash_cache[path]
+                        entries.append((doorstop_file, path, size, mtime, digest))
+                        bus.advance(1, size)
+
+                bus.start_phase("write", "Writing pack")
+                bus.set_total(len(entries))
+                self._write_archive(
+                    pack_path,
+                    entries,
+                    {"game": game_name, "source": bepinex_source},
+                    lambda size: bus.advance(1, size),
+                    token,
+                )
+        except OperationCancelled:
+            console.print("[warning]Export canceled; no pack was written.[/warning]")
+            return False
+        except Exception as e:
+            Logger.error(f"Error exporting pack: {e}")
+            console.print(f"[error]Error exporting pack: {e}[/error]")
+            return False
+
+        console.print(
+            f"[success]Exported {len(entries)} files to [path]{pack_path}[/path][/success]"
+        )
+        return True
+
+    def _write_archive(
+        self,
+        pack_path: str,
+        entries: List[Tuple[str, str, int, int, Optional[str]]],
+        info: Dict[str, Any],
+        on_progress=None,
+        cancel: Optional[CancelToken] = None,
+    ):
+        """
+        Write (arcname, path, size, mtime_ns, sha256) entries to a .zip,
+        .tar.{gz,bz2,xz} or .t{gz,bz2,xz} archive, preceded by a manifest
+        describing them.
+        A failed or canceled write removes the partial archive.
+        """
+        manifest = dict(info)
+        manifest["created"] = datetime.datetime.now().isoformat()
+        manifest["files"] = {
+            name: [size, mtime, digest] for name, _, size, mtime, digest in entries
+        }
+        manifest = json.dumps(manifest).encode("utf-8")
+
+        try:
+            self._write_archive_entries(pack_path, entries, manifest, on_progress, cancel)
+        except BaseException:
+            if os.path.lexists(pack_path):
+                os.unlink(pack_path)
+            raise
+
+    def _write_archive_entries(
+        self,
+        pack_path: str,
+        entries: List[Tuple[str, str, int, int, Optional[str]]],
+        manifest: bytes,
+        on_progress,
+        cancel: Optional[CancelToken],
+    ):
+        if pack_path.lower().endswith(".zip"):
+            with zipfile.ZipFile(
+                pack_path,
+                "w",
+                zipfile.ZIP_DEFLATED,
+                compresslevel=self.config.get("pack_compresslevel", 6),
+            ) as archive:
+                # Manifest first, so readers can plan before extracting
+                archive.writestr(self.PACK_MANIFEST, manifest)
+                for arcname, path, size, _, _ in entries:
+                    if cancel is not None:
+                        cancel.check()
+                    archive.write(path, arcname)
+                    if on_progress:
+                        on_progress(size)
+        else:
+            mode = {
+                ".gz": "w:gz",
+                ".tgz": "w:gz",
+                ".bz2": "w:bz2",
+                ".tbz2": "w:bz2",
+                ".xz": "w:xz",
+                ".txz": "w:xz",
+            }.get(os.path.splitext(pack_path)[1].lower(), "w")
+            with tarfile.open(pack_path, mode) as archive:
+                header = tarfile.TarInfo(self.PACK_MANIFEST)
+                header.size = len(manifest)
+                header.mtime = int(time.time())
+                archive.addfile(header, io.BytesIO(manifest))
+                for arcname, path, size, _, _ in entries:
+                    if cancel is not None:
+                        cancel.check()
+                    archive.add(path, arcname)
+                    if on_progress:
+                        on_progress(size)
+
+    def _pack_destination(self, game_dir: str, arcname: str) -> str:
+        """
+        Map a pack entry to its path in the game directory. Only files under
+        BepInEx/ and the doorstop files are accepted; absolute, drive, UNC
+        and parent-relative names raise ValueError, as does anything that
+        resolves outside the game directory.
+        """
+        parts = arcname.replace("\\", "/").split("/")
+        if parts[0] == "BepInEx" and len(parts) > 1:
+            safe = all(part not in ("", ".", "..") and ":" not in part for part in parts)
+        else:
+            safe = len(parts) == 1 and parts[0] in ("winhttp.dll", "doorstop_config.ini")
+        if not safe:
+            raise ValueError(f"Unsafe path in pack: {arcname}")
+
+        destination = os.path.join(game_dir, *parts)
+        root = os.path.realpath(game_dir)
+        if os.path.commonpath([root, os.path.realpath(destination)]) != root:
+            raise ValueError(f"Unsafe path in pack: {arcname}")
+        return destination
+
+    def import_pack(self, pack_path: str, game_exe_path: str) -> bool:
+        """
+        Extract a pack (or backup snapshot) straight into the game directory.
+        The existing BepInEx folder is moved aside first; files that are
+        identical to the pack are relinked from it instead of extracted, and
+        zip entries are decompressed in parallel. If extraction fails or is
+        canceled, the previous folder is put back.
+        """
+        game_dir = os.path.dirname(os.path.abspath(game_exe_path))
+        target_bepinex = os.path.join(game_dir, "BepInEx")
+        is_zip = zipfile.is_zipfile(pack_path)
+
+        try:
+            if is_zip:
+                with zipfile.ZipFile(pack_path) as archive:
+                    pack = json.loads(archive.read(self.PACK_MANIFEST))
+            else:
+                with tarfile.open(pack_path) as archive:
+                    pack = json.load(archive.extractfile(self.PACK_MANIFEST))
+        except (OSError, KeyError, ValueError, tarfile.TarError) as e:
+            console.print(f"[error]Not a Thunderinex pack: {e}[/error]")
+            return False
+
+        console.print(
+            f"Importing pack for [highlight]{pack.get('game')}[/highlight] into [path]{game_dir}[/path]"
+        )
+
+        transaction = InstallTransaction(self, game_dir)
+        wanted = {}
+        try:
+            # Entry names as written on Windows may use backslashes
+            names = {arcname: arcname.replace("\\", "/") for arcname in pack["files"]}
+            destinations = {
+                arcname: self._pack_destination(game_dir, arcname)
+                for arcname in pack["files"]
+            }
+            if self._pack_installed(game_dir, pack, names):
+                console.print(
+                    "[success]This pack is already installed; nothing to import.[/success]"
+                )
+                return True
+
+            if not self._confirm_replace(target_bepinex):
+                return False
+
+            with self._cancellable() as token, self._progress_session() as bus:
+                transaction.begin(bus)
+
+                # Only extract entries that differ from what is on disk
+                bus.start_phase("compare", "Comparing with installed files")
+                bus.set_total(len(pack["files"]))
+                for arcname, (size, mtime, digest) in pack["files"].items():
+                    destination = destinations[arcname]
+                    existing = destination
+                    if transaction.aside is not None and names[arcname].startswith(
+                        "BepInEx/"
+                    ):
+                        existing = os.path.join(
+                            transaction.aside, os.path.relpath(destination, target_bepinex)
+                        )
+                    bus.advance()
+                    token.check()
+                    if self._is_identical(existing, size, mtime, digest):
+                        if existing != destination:
+                            self.fs.makedirs(os.path.dirname(destination), exist_ok=True)
+                            try:
+                                self.fs.link(existing, destination)
+                            except OSError:
+                                self.fs.copyfile(existing, destination)
+                                self.fs.copystat(existing, destination)
+                        continue
+                    wanted[arcname] = (destination, mtime, size)
+
+                bus.start_phase("extract", "Extracting pack")
+                bus.set_total(len(wanted))
+                workers = token.child()  # Cancelled on its own if a worker fails
+
+                def write_entry(source, arcname):
+                    destination, mtime, size = wanted[arcname]
+                    # Doorstop files are only swapped in at commit
+                    nested = "/" in names[arcname]
+                    partial = (
+                        destination + self.PARTIAL_SUFFIX
+                        if nested
+                        else transaction.stage(destination)
+                    )
+                    self.fs.makedirs(os.path.dirname(destination), exist_ok=True)
+                    try:
+                        with self.fs.open(partial, "wb") as f:
+                            for chunk in iter(lambda: source.read(1024 * 1024), b""):
+                                workers.check()
+                                f.write(chunk)
+                        self.fs.utime(partial, ns=(mtime, mtime))
+                    except BaseException:
+                        self.fs.unlink(partial)
+                        raise
+                    if nested:
+                        # Replacing never writes through a hardlink
+                        self.fs.replace(partial, destination)
+                    bus.advance(1, size)
+
+                if is_zip:
+                    local = threading.local()
+                    handles = []
+
+                    def extract(arcname):
+                        workers.check()
+                        # ZipFile handles are not thread safe; open one per worker
+                        if not hasattr(local, "archive"):
+                            local.archive = zipfile.ZipFile(pack_path)
+                            handles.append(local.archive)
+                        with local.archive.open(arcname) as source:
+                            write_entry(source, arcname)
+
+                    try:
+                        with ThreadPoolExecutor(
+                            self.config.get("copy_workers", 4)
+                        ) as pool:
+                            try:
+                                list(pool.map(extract, wanted))
+                            except BaseException:
+                                workers.cancel()  # Stop the remaining workers
+                                raise
+                    finally:
+                        for handle in handles:
+                            handle.close()
+                else:
+                    with tarfile.open(pack_path) as archive:
+                        for member in archive:
+                            if member.name in wanted:
+                                write_entry(archive.extractfile(member), member.name)
+
+                # Commit: nothing below checks for cancellation
+                bus.start_phase("finalize", "Recording install manifest")
+                transaction.commit()
+
+                # The pack is in place; later failures are only warnings
+                warnings = []
+                transaction.retire(bus, warnings)
+
+                def record_manifest():
+                    files = FileManifest()
+                    for arcname, (size, mtime, digest) in pack["files"].items():
+                        name = names[arcname]
+                        if name.startswith("BepInEx/"):
+                            row = files.add_path(name[len("BepInEx/") :], size, mtime)
+                            files.set_digest(row, digest)
+
+                    previous = self._load_install_manifest(game_dir) or {}
+                    doorstop = {name for name in names.values() if "/" not in name}
+                    doorstop.update(
+                        name
+                        for name in previous.get("doorstop", [])
+                        if self.fs.exists(os.path.join(game_dir, name))
+                    )
+
+                    self._write_install_manifest(
+                        game_dir,
+                        {
+                            "source": os.path.abspath(pack_path),
+                            "game": pack.get("game"),
+                            "timestamp": datetime.datetime.now().isoformat(),
+                            "files": files,
+                            "doorstop": sorted(doorstop),
+                        },
+                    )
+
+                self._after_commit(
+                    bus, warnings, "recording the install manifest", record_manifest
+                )
+                bus.advance()
+        except Exception as e:
+            restored = transaction.active and transaction.roll_back("import")
+            if isinstance(e, OperationCancelled):
+                console.print(
+                    "[warning]Import canceled; "
+                    + (
+                        "the previous BepInEx folder was restored."
+                        if restored
+                        else "the partial extraction was removed."
+                    )
+                    + "[/warning]"
+                )
+                return False
+            Logger.error(f"Error importing pack: {e}")
+            console.print(f"[error]Error during import: {e}[/error]")
+            return False
+
+        console.print(
+            f"\n[success]Imported {len(wanted)} files ({len(pack['files']) - len(wanted)} already up to date).[/success]"
+        )
+        return True
+
+    def _pack_installed(
+        self, game_dir: str, pack: Dict[str, Any], names: Dict[str, str]
+    ) -> bool:
+        """
+        True if the install manifest lists exactly the pack's BepInEx files
+        and every pack entry on disk still matches, so an import would
+        change nothing.
+        """
+        installed = self._load_install_manifest(game_dir)
+        if installed is None or installed.get("files") is None:
+            return False
+        expected = {
+            name[len("BepInEx/") :] for name in names.values() if name.startswith("BepInEx/")
+        }
+        if set(installed["files"]) != expected:
+            return False
+        return all(
+            self._is_identical(
+                os.path.join(game_dir, *names[arcname].split("/")), size, mtime, digest
+            )
+            for arcname, (size, mtime, digest) in pack["files"].items()
+        )
+
+    def _is_identical(
+        self, path: str, size: int, mtime: int, digest: Optional[str]
+    ) -> bool:
+        """Check a file against a pack entry; snapshots without digests compare mtimes."""
+        try:
+            st = self.fs.stat(path)
+        except OSError:
+            return False
+        if st.st_size != size:
+            return False
+        if digest is None:
+            return st.st_mtime_ns == mtime
+        return self._file_digest(path) == digest
+
+    def restore_snapshot(self, game_exe_path: str, snapshot: Optional[str] = None) -> bool:
+        """Restore a backup snapshot (the newest by default) into the game directory."""
+        game_dir = os.path.dirname(os.path.abspath(game_exe_path))
+        snapshots = self.list_snapshots(game_dir)
+        if snapshot is None:
+            if not snapshots:
+                console.print("[error]No backup snapshots found for this game.[/error]")
+                return False
+            snapshot = snapshots[-1]
+        elif not os.path.isabs(snapshot):
+            snapshot = os.path.join(game_dir, ".thunderinex_backups", snapshot)
+
+        if not os.path.isfile(snapshot):
+            console.print(f"[error]Snapshot not found: {snapshot}[/error]")
+            return False
+
+        # Let snapshots still being written finish first
+        self.wait_for_backups()
+
+        console.print(f"Restoring backup snapshot [path]{snapshot}[/path]")
+        return self.import_pack(snapshot, game_exe_path)
+
+    def _move_to_trash(self, path: str) -> str:
+        """
+        Rename path into the game directory's trash folder and return its new
+        location. Renaming stays on the same volume, so it is instant. The
+        entry is not swept until it is deleted or renamed back; its name
+        carries this process's id so other instances leave it alone too.
+        """
+        trash_dir = os.path.join(os.path.dirname(path), ".thunderinex_trash")
+        self.fs.makedirs(trash_dir, exist_ok=True)
+        trashed = os.path.join(
+            trash_dir, f"{os.path.basename(path)}_{os.getpid()}_{time.time_ns()}"
+        )
+        with self._catalogue_lock:
+            self._deleting.add(trashed)
+        try:
+            self.fs.rename(path, trashed)
+        except BaseException:
+            with self._catalogue_lock:
+                self._deleting.discard(trashed)
+            raise
+        return trashed
+
+    def _trash_in_use(self, path: str) -> bool:
+        """True if a trash entry belongs to a running operation."""
+        if path in self._deleting:
+            return True
+        match = re.search(r"_(\d+)_\d+$", os.path.basename(path))
+        if match is None:
+            return False  # Named before entries carried their owner
+        pid = int(match.group(1))
+        return pid != os.getpid() and process_alive(pid)
+
+    def _remove_trashed(self, path: str):
+        if self.fs.isdir(path):
+            self.fs.rmtree(path, ignore_errors=True)
+        elif self.fs.lexists(path):
+            self.fs.unlink(path)
+
+    def _delete_in_background(self, path: str) -> threading.Thread:
+        """
+        Delete a trashed tree on a background thread. The thread is not a
+        daemon, so the process finishes the deletion before exiting; trash
+        left behind by an interrupted run is swept on the next delete.
+        """
+
+        with self._catalogue_lock:
+            self._deleting.add(path)
+
+        def delete():
+            try:
+                self._remove_trashed(path)
+            except Exception as e:
+                Logger.error(f"Error deleting {path}: {e}")
+            finally:
+                with self._catalogue_lock:
+                    self._deleting.discard(path)
+
+            # Sweep leftovers of finished or interrupted runs and drop the
+            # empty trash folder
+            trash_dir = os.path.dirname(path)
+            try:
+                with self._catalogue_lock:
+                    leftovers = [
+                        os.path.join(trash_dir, name)
+                        for name in self.fs.listdir(trash_dir)
+                        if not self._trash_in_use(os.path.join(trash_dir, name))
+                    ]
+                for leftover in leftovers:
+                    self._remove_trashed(leftover)
+                self.fs.rmdir(trash_dir)
+            except OSError:
+                pass  # Another deletion is still using the trash folder
+
+        thread = threading.Thread(target=delete, name="thunderinex-delete")
+        thread.start()
+        return thread
+
+    def uninstall_bepinex(self, game_exe_path: str) -> bool:
+        """
+        Remove the files recorded in the game's install manifest. The BepInEx
+        folder is moved aside immediately; installed files are deleted in the
+        background and anything Thunderinex did not install is put back.
+        """
+        game_dir = os.path.dirname(os.path.abspath(game_exe_path))
+        target_bepinex = os.path.join(game_dir, "BepInEx")
+        manifest = self._load_install_manifest(game_dir)
+
+        if manifest is None:
+            console.print(
+                "[warning]No install manifest found; this folder was not installed by Thunderinex.[/warning]"
+            )
+            if not self.interactive or not Confirm.ask(
+                "Remove the whole BepInEx folder and doorstop files anyway?"
+            ):
+                console.print("[info]Uninstall canceled.[/info]")
+                return False
+            manifest = {"files": None, "doorstop": ["winhttp.dll", "doorstop_config.ini"]}
+
+        # Everything is only renamed until the last step that can fail, so
+        # an error puts it all back; deleting happens afterwards
+        trashed = []
+        undo = []  # (current path, original path) of every rename, newest last
+        try:
+            for doorstop_file in manifest.get("doorstop", []):
+                doorstop_path = os.path.join(game_dir, doorstop_file)
+                if self.fs.lexists(doorstop_path):
+                    trashed.append(self._move_to_trash(doorstop_path))
+                    undo.append((trashed[-1], doorstop_path))
+
+            if self.fs.isdir(target_bepinex):
+                trashed.append(self._move_to_trash(target_bepinex))
+                undo.append((trashed[-1], target_bepinex))
+                installed = manifest.get("files")
+                if installed is not None:
+                    self._keep_foreign_files(trashed[-1], target_bepinex, installed, undo)
+
+            manifest_path = self._install_manifest_path(game_dir)
+            if self.fs.lexists(manifest_path):
+                self.fs.unlink(manifest_path)
+        except Exception as e:
+            Logger.error(f"Error uninstalling BepInEx: {e}")
+            if self._undo_renames(undo):
+                console.print(
+                    f"[error]Error during uninstall: {e}. Nothing was removed.[/error]"
+                )
+            else:
+                console.print(
+                    f"[error]Error during uninstall: {e}. Some files could not be put "
+                    f"back; they are in [path]{os.path.join(game_dir, '.thunderinex_trash')}[/path][/error]"
+                )
+            return False
+
+        for path in trashed:
+            self._delete_in_background(path)
+        console.print("[success]BepInEx uninstalled.[/success]")
+        return True
+
+    def _undo_renames(self, undo: List[Tuple[str, str]]) -> bool:
+        """
+        Rename (current, original) pairs back, newest first. Folders left
+        empty by files moved out of them are removed so the original can be
+        renamed over them. Returns False if anything could not be restored.
+        """
+        restored = True
+        for current, original in reversed(undo):
+            try:
+                if self.fs.isdir(original):
+                    for directory in reversed([root for root, _, _ in self.fs.walk(original)]):
+                        self.fs.rmdir(directory)
+                self.fs.replace(current, original)
+            except OSError as e:
+                Logger.error(f"Error restoring {original}: {e}")
+                restored = False
+                continue
+            with self._catalogue_lock:
+                self._deleting.discard(current)
+        return restored
+
+    def _keep_foreign_files(
+        self,
+        trashed: str,
+        target_bepinex: str,
+        installed: FileManifest,
+        undo: List[Tuple[str, str]],
+    ):
+        """
+        Move files that were neither installed nor regenerable from a trashed
+        tree back into place, so uninstall only removes what install created.
+        Each move is appended to undo as (new path, trashed path).
+        """
+        kept = 0
+        for rel_dir, files in scan_copy_plan(trashed, self.path_filter, fs=self.fs):
+            for name, _ in files:
+                rel_path = f"{rel_dir}/{name}" if rel_dir else name
+                if rel_path in installed:
+                    continue
+                source = os.path.join(trashed, rel_path)
+                destination = os.path.join(target_bepinex, rel_path)
+                self.fs.makedirs(os.path.dirname(destination), exist_ok=True)
+                self.fs.replace(source, destination)
+                undo.append((destination, source))
+                kept += 1
+        if kept:
+            Logger.info(f"Kept {kept} files not installed by Thunderinex in {target_bepinex}")
+
+    def _stat_pair(self, source: str, installed: str) -> Optional[List[int]]:
+        """[size, source mtime, installed mtime] for a copied file, or None."""
+        try:
+            src, dst = self.fs.stat(source), self.fs.stat(installed)
+        except OSError:
+            return None
+        return [src.st_size, src.st_mtime_ns, dst.st_mtime_ns]
+
+    def _recent_manifest(self, bepinex_source: str, game_dir: str) -> Dict[str, Any]:
+        """
+        Manifest of an install as stored in recent games: a FileManifest with
+        source and installed mtimes, plus [size, mtime, installed mtime] per
+        doorstop file.
+        """
+        installed = self._load_install_manifest(game_dir)
+        files = installed["files"] if installed else None
+        if (
+            files is None
+            or installed.get("source") != bepinex_source
+            or not all(files.installed_mtimes[row] for row in files.rows())
+        ):
+            # Not recorded by the copy pipeline; stat both trees instead
+            target_bepinex = os.path.join(game_dir, "BepInEx")
+            files = FileManifest()
+            for rel_dir, entries in scan_copy_plan(
+                bepinex_source, self.path_filter, fs=self.fs
+            ):
+                for name, _ in entries:
+                    rel_path = f"{rel_dir}/{name}" if rel_dir else name
+                    record = self._stat_pair(
+                        os.path.join(bepinex_source, rel_path),
+                        os.path.join(target_bepinex, rel_path),
+                    )
+                    if record:
+                        files.add(rel_dir, name, *record)
+
+        doorstop = {}
+        for doorstop_file in ["winhttp.dll", "doorstop_config.ini"]:
+            record = self._stat_pair(
+                os.path.join(os.path.dirname(bepinex_source), doorstop_file),
+                os.path.join(game_dir, doorstop_file),
+            )
+            if record:
+                doorstop[doorstop_file] = record
+        return {"files": files, "doorstop": doorstop}
+
+    def _unchanged(
+        self, record: Optional[List[int]], source: str, installed: str, size: int
+    ) -> bool:
+        """Check a file pair against its recent-manifest record."""
+        if not record or record[0] != size:
+            return False
+        try:
+            if self.fs.stat(source).st_mtime_ns != record[1]:
+                return False
+            st = self.fs.stat(installed)
+        except OSError:
+            return False
+        return st.st_size == size and st.st_mtime_ns == record[2]
+
+    def sync_recent_game(self, game: Dict[str, Any]) -> bool:
+        """
+        Reinstall a recent game by copying only the files that changed since
+        its last install and removing the ones that are gone. Falls back to a
+        full install when no manifest was recorded or the source has moved.
+        Each file is swapped in whole, so a canceled sync records exactly the
+        changes it applied.
+        """
+        game_name = game.get("name")
+        game_path = game.get("path")
+        exe_path = game.get("exe")
+        profile = game.get("profile")
+        if not exe_path or not self.fs.exists(exe_path):
+            Logger.error(f"Game executable not found: {exe_path}")
+            console.print(f"[error]Game executable not found: {exe_path}[/error]")
+            return False
+
+        game_dir = os.path.dirname(exe_path)
+        target_bepinex = os.path.join(game_dir, "BepInEx")
+        bepinex_source = game.get("bepinex")
+        recorded = game.get("manifest")
+        if isinstance(recorded, str):
+            recorded = self._load_cache(recorded) or None
+
+        # One stat validates the cached source; only search if it is gone
+        if not bepinex_source or not self.fs.isdir(bepinex_source):
+            bepinex_source = self.find_bepinex_folder(game_path, profile)
+            recorded = None
+            if not bepinex_source:
+                Logger.error(f"BepInEx folder not found for {game_name}.")
+                console.print(
+                    f"[error]BepInEx folder not found for {game_name}.[/error]"
+                )
+                return False
+
+        if not recorded or not self.fs.isdir(target_bepinex):
+            success = self.install_bepinex(bepinex_source, exe_path, game_name)
+            if success:
+                self._add_recent_game(
+                    game_name, game_path, exe_path, bepinex_source, profile
+                )
+            return success
+
+        console.print(
+            f"Syncing BepInEx from [path]{bepinex_source}[/path] to [path]{game_dir}[/path]"
+        )
+        result = self.last_result = {
+            "operation": "sync",
+            "ok": False,
+            "game": game_name,
+            "game_dir": game_dir,
+            "bepinex_source": bepinex_source,
+            "backup": None,
+        }
+        files = FileManifest.from_json(recorded.get("files"))
+        doorstop = dict(recorded.get("doorstop", {}))
+        skipped: Counter = Counter()
+        strategies: Counter = Counter()
+
+        bus = None
+        changed = []  # (key, source, installed, size)
+        removed = []
+        applied = []  # The entries of changed and removed actually done
+        try:
+            with self._cancellable() as token, self._progress_session() as bus:
+                bus.start_phase("compare", "Comparing with last install")
+                seen = bytearray(len(files.names))  # One flag per recorded row
+                unchanged = 0
+                for rel_dir, entries in scan_copy_plan(
+                    bepinex_source, self.path_filter, skipped, token, self.fs
+                ):
+                    for name, size in entries:
+                        rel_path = f"{rel_dir}/{name}" if rel_dir else name
+                        row = files.find(rel_path)
+                        source = os.path.join(bepinex_source, rel_path)
+                        installed = os.path.join(target_bepinex, rel_path)
+                        if row is not None:
+                            seen[row] = 1
+                        if row is not None and self._unchanged(
+                            files.record(row), source, installed, size
+                        ):
+                            unchanged += 1
+                        else:
+                            changed.append((rel_path, source, installed, size))
+                        bus.advance()
+                removed.extend(files.path(row) for row in files.rows() if not seen[row])
+
+                for doorstop_file in ["winhttp.dll", "doorstop_config.ini"]:
+                    source = os.path.join(os.path.dirname(bepinex_source), doorstop_file)
+                    installed = os.path.join(game_dir, doorstop_file)
+                    if not self.fs.exists(source):
+                        continue
+                    size = self.fs.stat(source).st_size
+                    if not self._unchanged(doorstop.get(doorstop_file), source, installed, size):
+                        changed.append((None, source, installed, size))
+
+                bus.start_phase("sync", "Copying changed files")
+                bus.set_total(len(changed) + len(removed))
+                store = self._open_store(game_dir)
+                copier = self._build_copier(
+                    store=store,
+                    store_filter=PathFilter(include=self.config.get("dedup_patterns", [])),
+                )
+                cancelled = False
+                try:
+                    for item in changed:
+                        rel_path, source, installed, size = item
+                        self.fs.makedirs(os.path.dirname(installed), exist_ok=True)
+                        strategies[
+                            self._copy_replace(
+                                copier,
+                                source,
+                                installed,
+                                size,
+                                rel_path or os.path.basename(installed),
+                            )
+                        ] += 1
+                        applied.append(item)
+                        record = self._stat_pair(source, installed)
+                        if rel_path is None:
+                            doorstop[os.path.basename(installed)] = record
+                        elif record:
+                            row = files.find(rel_path)
+                            if row is None:
+                                files.add_path(rel_path, *record)
+                            else:
+                                files.sizes[row], files.mtimes[row], files.installed_mtimes[row] = record
+                        bus.advance(1, size)
+
+                    for rel_path in removed:
+                        token.check()
+                        path = os.path.join(target_bepinex, *rel_path.split("/"))
+                        if self.fs.lexists(path):
+                            self.fs.unlink(path)
+                        # Drop directories the removal left empty
+                        parent = os.path.dirname(path)
+                        while parent != target_bepinex:
+                            try:
+                                self.fs.rmdir(parent)
+                            except OSError:
+                                break
+                            parent = os.path.dirname(parent)
+                        files.remove(rel_path)
+                        applied.append(rel_path)
+                        bus.advance()
+                except OperationCancelled:
+                    # Record the changes already made so the next sync resumes
+                    cancelled = True
+                    bus.end_phase("cancelled")
+
+                bus.start_phase("finalize", "Recording install manifest")
+                if store is not None:
+                    store.save()
+
+                install_manifest = self._load_install_manifest(game_dir) or {
+                    "files": FileManifest()
+                }
+                installed_files = install_manifest["files"]
+                done = [item for item in applied if isinstance(item, tuple)]
+                for rel_path, _, _, _ in done:
+                    row = files.find(rel_path) if rel_path is not None else None
+                    if row is None:
+                        continue
+                    target_row = installed_files.find(rel_path)
+                    if target_row is None:
+                        target_row = installed_files.add_path(rel_path, 0)
+                    installed_files.sizes[target_row] = files.sizes[row]
+                    installed_files.mtimes[target_row] = files.mtimes[row]
+                    installed_files.installed_mtimes[target_row] = files.installed_mtimes[row]
+                    installed_files.set_digest(target_row, None)
+                gone = [item for item in applied if isinstance(item, str)]
+                for rel_path in gone:
+                    installed_files.remove(rel_path)
+                install_manifest.update(
+                    source=bepinex_source,
+                    game=game_name,
+                    timestamp=datetime.datetime.now().isoformat(),
+                    doorstop=sorted(doorstop),
+                )
+                self._write_install_manifest(game_dir, install_manifest)
+                self._add_recent_game(
+                    game_name,
+                    game_path,
+                    exe_path,
+                    bepinex_source,
+                    profile,
+                    {"files": files, "doorstop": doorstop},
+                )
+                bus.advance()
+
+            result.update(
+                ok=not cancelled,
+                strategies=dict(strategies),
+                files_copied=len(done),
+                bytes_copied=sum(item[3] for item in done),
+                files_removed=len(gone),
+                files_unchanged=unchanged,
+                files_skipped=skipped["files"],
+                bytes_skipped=skipped["bytes"],
+                dirs_skipped=skipped["dirs"],
+            )
+            if cancelled:
+                result.update(error="canceled", cancelled=True)
+                console.print(
+                    f"[warning]Sync of {game_name} canceled after {len(applied)} of "
+                    f"{len(changed) + len(removed)} changes ({len(done)} copied, "
+                    f"{len(gone)} removed); run it again to finish.[/warning]"
+                )
+                return False
+            console.print(
+                f"\n[success]Synced {game_name}: {len(changed)} files updated, "
+                f"{len(removed)} removed, {result['files_unchanged']} unchanged.[/success]"
+            )
+            return True
+
+        except OperationCancelled:
+            # Canceled while comparing: nothing on disk was changed yet
+            result.update(error="canceled", cancelled=True, files_copied=0)
+            console.print(
+                f"[warning]Sync of {game_name} canceled; nothing was changed.[/warning]"
+            )
+            return False
+        except Exception as e:
+            result["error"] = str(e)
+            Logger.error(f"Error syncing BepInEx: {e}")
+            console.print(f"[error]Error during sync: {e}[/error]")
+            return False
+        finally:
+            if bus is not None:
+                result["phases"] = {
+                    name: round(duration, 3) for name, duration in bus.durations.items()
+                }
+
+    def reinstall_recent_games(self) -> List[Dict[str, Any]]:
+        """Sync every recent game in turn. Returns each game's result."""
+        results = []
+        # Syncing reorders recent_games, so walk a copy
+        for game in list(self.recent_games):
+            self.last_result = {"operation": "sync", "ok": False, "game": game.get("name")}
+            self.sync_recent_game(game)
+            results.append(self.last_result)
+        return results
+
+    def _install_manifest_path(self, game_dir: str) -> str:
+        return os.path.join(game_dir, ".thunderinex_manifest.json")
+
+    def _write_install_manifest(self, game_dir: str, manifest: Dict[str, Any]):
+        """Record what an install put into the game directory."""
+        try:
+            with open(self._install_manifest_path(game_dir), "w") as f:
+                json.dump(
+                    {**manifest, "files": manifest["files"].to_json()},
+                    f,
+                    separators=(",", ":"),
+                )
+        except Exception as e:
+            Logger.error(f"Error saving install manifest: {e}")
+
+    def _load_install_manifest(self, game_dir: str) -> Optional[Dict[str, Any]]:
+        """Load the manifest of the last install, if any; "files" is a FileManifest."""
+        path = self._install_manifest_path(game_dir)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "r") as f:
+                manifest = json.load(f)
+            manifest["files"] = FileManifest.from_json(manifest.get("files"))
+            return manifest
+        except Exception as e:
+            Logger.error(f"Error loading install manifest: {e}")
+            return None
+
+    # Launchers, crash reporters and installers shipped next to games
+    EXE_IGNORE = ("unitycrashhandler", "unins", "crashreport", "vc_redist", "dxsetup", "setup")
+
+    def _library_roots(self) -> List[str]:
+        """Existing game library folders, built-in ones first."""
+        roots = []
+        for root in self.library_roots + self.config.get("game_library_roots", []):
+            root = os.path.abspath(os.path.expanduser(root))
+            if root not in roots and self.fs.isdir(root):
+                roots.append(root)
+        return roots
+
+    def _scan_game_folder(self, folder: str) -> List[str]:
+        """
+        Find a game folder's executables at most exe_scan_depth levels deep:
+        every X.exe next to an X_Data folder (Unity), or failing that any
+        other .exe in the top two levels that is not a known helper.
+        """
+        max_depth = self.config.get("exe_scan_depth", 3)
+        unity, other = [], []
+        pending = [(folder, 0)]
+        while pending:
+            path, depth = pending.pop()
+            try:
+                with self.fs.scandir(path) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+            dirs = {
+                entry.name.lower(): entry.path
+                for entry in entries
+                if entry.is_dir(follow_symlinks=False)
+            }
+            for entry in entries:
+                if not entry.name.lower().endswith(".exe") or not entry.is_file():
+                    continue
+                stem = entry.name[:-4].lower()
+                if f"{stem}_data" in dirs:
+                    unity.append(entry.path)
+                elif depth <= 1 and not stem.startswith(self.EXE_IGNORE):
+                    other.append(entry.path)
+            if depth < max_depth:
+                # Unity data folders never hold the game executable
+                pending.extend(
+                    (sub, depth + 1) for name, sub in dirs.items() if not name.endswith("_data")
+                )
+        return sorted(unity) or sorted(other)
+
+    def index_executables(self) -> Dict[str, List[str]]:
+        """
+        Index candidate executables under the game library folders as
+        {game_folder: [exe_path, ...]}. Game folders are scanned in parallel
+        and cached in executables.json until their mtime changes.
+        """
+        with self._exe_index_lock:
+            folders = {}
+            for root in self._library_roots():
+                try:
+                    with self.fs.scandir(root) as it:
+                        for entry in it:
+                            if entry.is_dir():
+                                folders[entry.path] = entry.stat().st_mtime_ns
+                except OSError as e:
+                    Logger.error(f"Error listing game library {root}: {e}")
+
+            cache = self._load_cache("executables.json")
+            index, stale = {}, []
+            for folder, mtime in folders.items():
+                cached = cache.get(folder)
+                if cached and cached["mtime"] == mtime:
+                    index[folder] = cached["exes"]
+                else:
+                    stale.append(folder)
+            if stale:
+                found, timed_out = scan_parallel(
+                    stale,
+                    self._scan_game_folder,
+                    self.config.get("scan_workers", 8),
+                    self.config.get("scan_timeout", 10),
+                )
+                index.update(found)
+                debug_event("exe_index", scanned=len(stale), timed_out=timed_out)
+
+            updated = {
+                folder: {"mtime": folders[folder], "exes": exes}
+                for folder, exes in index.items()
+            }
+            if updated != cache:
+                self._save_cache("executables.json", updated)
+            return index
+
+    @staticmethod
+    def _name_key(name: str) -> str:
+        """Lowercase a name and drop everything but letters and digits."""
+        return re.sub(r"[^a-z0-9]", "", name.lower())
+
+    def match_executables(self, game_name: str) -> List[Tuple[str, float]]:
+        """
+        Rank indexed executables by how well their folder or file name
+        matches game_name. Returns (exe_path, similarity), best first.
+        """
+        matcher = difflib.SequenceMatcher(None, b=self._name_key(game_name))
+        matches = []
+        for folder, exes in self.index_executables().items():
+            matcher.set_seq1(self._name_key(os.path.basename(folder)))
+            folder_score = matcher.ratio()
+            for exe in exes:
+                matcher.set_seq1(self._name_key(os.path.splitext(os.path.basename(exe))[0]))
+                matches.append((exe, max(folder_score, matcher.ratio())))
+        return sorted(matches, key=lambda x: x[1], reverse=True)
+
+    def find_game_executable(self, game_name: str) -> Optional[str]:
+        """
+        Pair a Thunderstore game folder with its executable: the one last
+        used for it, else the single clear best match from the index.
+        """
+        for game in self.recent_games:
+            if game.get("name") == game_name and game.get("exe"):
+                if self.fs.exists(game["exe"]):
+                    return game["exe"]
+        matches = self.match_executables(game_name)
+        if not matches or matches[0][1] < 0.8:
+            return None
+        if len(matches) > 1 and matches[1][1] == matches[0][1]:
+            return None  # Ambiguous; let the user choose
+        return matches[0][0] if self.fs.exists(matches[0][0]) else None
+
+    def choose_executable(self, game_name: str) -> Optional[str]:
+        """Offer indexed executables for a game, falling back to a file dialog."""
+        suggestions = [
+            (path, score) for path, score in self.match_executables(game_name) if score > 0.5
+        ]
+        if suggestions:
+            choices = [
+                {"name": f"{path} (similarity: {score:.2f})", "value": path}
+                for path, score in suggestions[:5]
+            ]
+            choices.append({"name": "Browse for another executable...", "value": ""})
+            selection = questionary.select(
+                "Select the game's executable:", choices=choices, style=questionary_style
+            ).ask()
+            if selection is None:
+                return None
+            if selection:
+                return selection
+
+        console.print(
+            "\n[info]Please select the game's executable (.exe) file...[/info]"
+        )
+        return self.select_exe_file()
 
     def select_exe_file(self, initial_dir=None) -> Optional[str]:
         """Open a file dialog to select the game executable."""
-        # Create and hide the root window
-        root = tk.Tk()
+        # tkinter is only needed here, and may be missing or have no display
+        try:
+            import tkinter as tk
+            from tkinter import filedialog
+
+            root = tk.Tk()
+        except Exception:
+            exe_path = questionary.path(
+                "Path to the game executable:", style=questionary_style
+            ).ask()
+            return exe_path if exe_path and os.path.isfile(exe_path) else None
+        # Hide the root window
         root.withdraw()
 
         # Set initial directory to desktop if none provided
@@ -496,7 +4428,7 @@ class ThunderModInstaller:
             game_name = os.path.splitext(os.path.basename(exe_path))[0]
             shortcut_path = os.path.join(desktop, f"{game_name} (Modded).lnk")
 
-            with yaspin(Spinners.pulse, text="Creating shortcut...") as sp:
+            with spinner(Spinners.pulse, "Creating shortcut...") as sp:
                 shell = win32com.client.Dispatch("WScript.Shell")
                 shortcut = shell.CreateShortCut(shortcut_path)
                 shortcut.Targetpath = exe_path
@@ -559,6 +4491,11 @@ class ThunderModInstaller:
                 f"Search depth: {self.config.get('search_depth', 5)}",
                 f"Auto backup: {'Enabled' if self.config.get('auto_backup', True) else 'Disabled'}",
                 f"Maximum recent games: {self.config.get('max_recent_games', 10)}",
+                f"Copy exclusion rules: {len(self.config.get('copy_exclude', []))} pattern(s)",
+                f"Deduplicated store: {'Enabled' if self.config.get('dedup_store', False) else 'Disabled'}",
+                f"I/O throttle: {self.config.get('throttle_mbps', 0) or 'Unlimited'} MB/s",
+                f"Low priority mode: {'Enabled' if self.config.get('low_priority', False) else 'Disabled'}",
+                f"Game library folders: {len(self.config.get('game_library_roots', []))} extra folder(s)",
                 "Add custom Thunderstore path",
                 "View custom paths",
                 "Back to main menu",
@@ -610,6 +4547,92 @@ class ThunderModInstaller:
                     self._save_config()
                     console.print("[success]Maximum recent games updated.[/success]")
 
+            elif "I/O throttle" in choice:
+                mbps = questionary.text(
+                    "Maximum copy speed in MB/s (0 for unlimited):",
+                    default=str(self.config.get("throttle_mbps", 0)),
+                    validate=lambda x: x.replace(".", "", 1).isdigit(),
+                    style=questionary_style,
+                ).ask()
+
+                if mbps:
+                    self.config["throttle_mbps"] = float(mbps)
+                    self._save_config()
+                    console.print("[success]I/O throttle updated.[/success]")
+
+            elif "Low priority mode" in choice:
+                low_priority = questionary.confirm(
+                    "Run installs at low CPU and I/O priority?",
+                    default=self.config.get("low_priority", False),
+                    style=questionary_style,
+                ).ask()
+
+                if low_priority is not None and low_priority != self.config.get(
+                    "low_priority", False
+                ):
+                    self.config["low_priority"] = low_priority
+                    self._save_config()
+                    if low_priority:
+                        set_low_priority()
+                    else:
+                        console.print(
+                            "[info]Normal priority applies from the next start.[/info]"
+                        )
+                    console.print("[success]Low priority setting updated.[/success]")
+
+            elif "Deduplicated store" in choice:
+                dedup = questionary.confirm(
+                    "Hardlink shared files (*.dll by default) from a per-drive store instead of copying them?",
+                    default=self.config.get("dedup_store", False),
+                    style=questionary_style,
+                ).ask()
+
+                if dedup is not None:
+                    self.config["dedup_store"] = dedup
+                    self._save_config()
+                    console.print("[success]Deduplicated store setting updated.[/success]")
+
+            elif "Game library folders" in choice:
+                roots = questionary.text(
+                    "Extra folders containing installed games (comma separated):",
+                    default=", ".join(self.config.get("game_library_roots", [])),
+                    style=questionary_style,
+                ).ask()
+
+                if roots is not None:
+                    self.config["game_library_roots"] = [
+                        r.strip() for r in roots.split(",") if r.strip()
+                    ]
+                    self._save_config()
+                    console.print("[success]Game library folders updated.[/success]")
+
+            elif "Copy exclusion rules" in choice:
+                exclude = questionary.text(
+                    "Exclude patterns (comma separated, e.g. cache, *.log):",
+                    default=", ".join(self.config.get("copy_exclude", [])),
+                    style=questionary_style,
+                ).ask()
+                if exclude is None:
+                    continue
+
+                include = questionary.text(
+                    "Include patterns (comma separated, empty for everything):",
+                    default=", ".join(self.config.get("copy_include", [])),
+                    style=questionary_style,
+                ).ask()
+                if include is None:
+                    continue
+
+                self.config["copy_exclude"] = [
+                    p.strip() for p in exclude.split(",") if p.strip()
+                ]
+                self.config["copy_include"] = [
+                    p.strip() for p in include.split(",") if p.strip()
+                ]
+                self.path_filter = self._build_path_filter()
+                self._save_config()
+                console.print("[success]Copy rules updated.[/success]")
+
             elif "Theme" in choice:
                 theme = questionary.select(
                     "Select theme:",
@@ -694,7 +4717,7 @@ class ThunderModInstaller:
             "- Before installing or re-installing, make sure you installed/removed all the mods you want to from the Thunderstore Mod Manager software."
         )
         console.print(
-            "- If you would like to delete BepInEx, go into the game's directory, and delete the folder."
+            '- If you would like to delete BepInEx, use the uninstall option from the "Recent Games" section, or the [cyan]uninstall[/cyan] command.'
         )
         console.print(
             '- If you would like to reinstall BepInEx, you can install it again, or use the re-install option from the "Recent Games" section.\n'
@@ -704,7 +4727,11 @@ class ThunderModInstaller:
         console.print(
             "- Select [cyan]View Recent Games[/cyan] to see recently modded games"
         )
-        console.print("- You can quickly reinstall BepInEx for these games\n")
+        console.print("- You can quickly reinstall or uninstall BepInEx for these games")
+        console.print(
+            "- Reinstalling with the same profile only copies files that changed; "
+            "[cyan]Reinstall all recent games[/cyan] or the [cyan]reinstall-recent[/cyan] command does it for every game\n"
+        )
 
         console.print("[bold]Adding Custom Paths[/bold]")
         console.print("If your Thunderstore Mod Manager is in a non-standard location:")
@@ -731,8 +4758,44 @@ class ThunderModInstaller:
             '[green]python thundermod_installer.py --game "Game Name" --exe-path "C:/path/to/game.exe"[/green]\n'
         )
 
+        console.print(
+            '[green]python thundermod_installer.py plugins --plugin "Author-Name" [--plugin-version 1.0.0][/green]'
+        )
+        console.print(
+            "[green]python thundermod_installer.py plugins --largest 10[/green]"
+        )
+        console.print(
+            "[green]python thundermod_installer.py gc-store[/green] removes unused files from the deduplicated store"
+        )
+        console.print(
+            '[green]python thundermod_installer.py uninstall --exe-path "C:/path/to/game.exe"[/green]'
+        )
+        console.print(
+            '[green]python thundermod_installer.py export-pack --game "Game Name" --pack modpack.zip[/green]'
+        )
+        console.print(
+            '[green]python thundermod_installer.py import-pack --pack modpack.zip --exe-path "C:/path/to/game.exe"[/green]'
+        )
+        console.print(
+            '[green]python thundermod_installer.py restore --exe-path "C:/path/to/game.exe" [--snapshot NAME][/green]\n'
+        )
+
         console.print("[bold underline]Additional Options[/bold underline]")
         console.print("Use the [cyan]--debug[/cyan] flag for verbose logging.")
+        console.print(
+            "Use [cyan]--profile NAME[/cyan] to install from a Thunderstore profile other than the default."
+        )
+        console.print(
+            "Use [cyan]--serve[/cyan] to keep a background service running; command line installs are forwarded to it."
+        )
+        console.print(
+            "Use [cyan]--throttle MBPS[/cyan] and [cyan]--low-priority[/cyan] to keep a running game responsive during big installs."
+        )
+        console.print(
+            "Use [cyan]--benchmark PATH[/cyan] to compare copy strategies on a BepInEx folder; "
+            "[cyan]--benchmark-workers 1,2,4,8[/cyan] picks the worker counts it compares and "
+            "[cyan]--simulate-fs hdd|smb|usb[/cyan] runs it against a simulated disk.\n"
+        )
         console.print(
             "The keybind [cyan]Ctrl + C[/cyan] will return you to the main menu.\n"
         )
@@ -787,6 +4850,9 @@ class ThunderModInstaller:
 
     def run(self):
         """Run the installer command line interface."""
+        # Warm the profile catalogue while the user navigates the menus
+        self.refresh_profile_catalogue()
+
         # Show welcome screen
 
         while True:
@@ -797,6 +4863,7 @@ class ThunderModInstaller:
             menu_options = [
                 "Install BepInEx",
                 "View Recent Games",
+                "Installed Plugins",
                 "Settings",
                 "Run As Administrator",
                 "Help",
@@ -831,6 +4898,9 @@ class ThunderModInstaller:
             elif "View Recent Games" in choice:
                 self._recent_games_workflow()
 
+            elif "Installed Plugins" in choice:
+                self._plugins_workflow()
+
             elif "Settings" in choice:
                 self.settings_menu()
 
@@ -849,6 +4919,11 @@ class ThunderModInstaller:
             console.print("You can add a custom path in Settings.")
             return False
 
+        # Index game executables while the user types
+        threading.Thread(
+            target=self.index_executables, name="thunderinex-exe-index", daemon=True
+        ).start()
+
         # Get game name from user
         game_name = questionary.text("Enter game name:", style=questionary_style).ask()
 
@@ -910,9 +4985,13 @@ class ThunderModInstaller:
 
             selected_game_dir, game_folder_name = selection
 
+        profile = self.select_profile(selected_game_dir)
+        if profile is None:
+            return False
+
         # Find BepInEx folder
         console.print("\n[info]Searching for BepInEx folder...[/info]")
-        bepinex_path = self.find_bepinex_folder(selected_game_dir)
+        bepinex_path = self.find_bepinex_folder(selected_game_dir, profile)
 
         if not bepinex_path:
             console.print(
@@ -926,11 +5005,8 @@ class ThunderModInstaller:
 
         console.print(f"Found BepInEx folder: [path]{bepinex_path}[/path]")
 
-        # Prompt user to select game executable
-        console.print(
-            "\n[info]Please select the game's executable (.exe) file...[/info]"
-        )
-        exe_path = self.select_exe_file()
+        # Suggest indexed executables, falling back to the file dialog
+        exe_path = self.choose_executable(game_folder_name)
 
         if not exe_path:
             console.print("[error]No executable selected.[/error]")
@@ -945,7 +5021,9 @@ class ThunderModInstaller:
 
         if success:
             # Add to recent games
-            self._add_recent_game(game_folder_name, selected_game_dir, exe_path)
+            self._add_recent_game(
+                game_folder_name, selected_game_dir, exe_path, bepinex_path, profile
+            )
 
             console.print(
                 "\n[success]✅ Installation successful! You can now launch the game and enjoy your mods.[/success]"
@@ -967,6 +5045,37 @@ class ThunderModInstaller:
 
         return success
 
+    def _plugins_workflow(self):
+        """Query the installed plugin index."""
+        with spinner(Spinners.dots, "Indexing installed plugins...") as sp:
+            index = self.build_plugin_index()
+            sp.ok("✓")
+        console.print(f"[info]{len(index)} plugins indexed.[/info]")
+
+        choice = questionary.select(
+            "What would you like to see?",
+            choices=["Find a plugin", "Largest plugins", "Back to main menu"],
+            style=questionary_style,
+        ).ask()
+
+        if choice == "Find a plugin":
+            name = questionary.text(
+                "Plugin name (or Author-Name):", style=questionary_style
+            ).ask()
+            if not name:
+                return
+            version = questionary.text(
+                "Version (leave empty for any):", style=questionary_style
+            ).ask()
+            self.display_plugins(
+                self.find_plugins(name, version or None), f"Plugin: {name}"
+            )
+            input("\nPress Enter to return to main menu...")
+
+        elif choice == "Largest plugins":
+            self.display_plugins(self.largest_plugins(), "Largest plugins")
+            input("\nPress Enter to return to main menu...")
+
     def _recent_games_workflow(self):
         if not self.recent_games:
             console.print("[info]No recent games found.[/info]")
@@ -978,10 +5087,11 @@ class ThunderModInstaller:
         choices = []
         for i, game in enumerate(self.recent_games):
             choices.append({"name": f"{game.get('name', 'Unknown')}", "value": i})
+        choices.append({"name": "Reinstall all recent games", "value": "all"})
         choices.append({"name": "Back to main menu", "value": "back"})
 
         selection = questionary.select(
-            "Select a game to reinstall BepInEx:",
+            "Select a game:",
             choices=choices,
             style=questionary_style,
         ).ask()
@@ -989,6 +5099,15 @@ class ThunderModInstaller:
         if selection is None or selection == "back":
             return
 
+        if selection == "all":
+            results = self.reinstall_recent_games()
+            failed = [r.get("game") for r in results if not r.get("ok")]
+            if failed:
+                console.print(f"\n[error]❌ Failed: {', '.join(failed)}[/error]")
+            else:
+                console.print("\n[success]✅ All recent games are up to date![/success]")
+            return
+
         # Get the selected game
         game = self.recent_games[selection]
         game_dir = game.get("path")
@@ -1015,9 +5134,64 @@ class ThunderModInstaller:
 
             return
 
+        action = questionary.select(
+            f"What would you like to do with {game_name}?",
+            choices=[
+                "Reinstall BepInEx",
+                "Restore a backup",
+                "Uninstall BepInEx",
+                "Back to main menu",
+            ],
+            style=questionary_style,
+        ).ask()
+
+        if action == "Uninstall BepInEx":
+            if questionary.confirm(
+                f"Uninstall BepInEx from {game_name}?",
+                default=False,
+                style=questionary_style,
+            ).ask():
+                self.uninstall_bepinex(exe_path)
+            return
+
+        if action == "Restore a backup":
+            snapshots = self.list_snapshots(os.path.dirname(exe_path))
+            if not snapshots:
+                console.print("[info]No backup snapshots for this game.[/info]")
+                return
+            snapshot = questionary.select(
+                "Select a snapshot to restore:",
+                choices=[
+                    {"name": os.path.basename(path), "value": path}
+                    for path in reversed(snapshots)
+                ],
+                style=questionary_style,
+            ).ask()
+            if snapshot:
+                self.restore_snapshot(exe_path, snapshot)
+            return
+
+        if action != "Reinstall BepInEx":
+            return
+
+        profile = self.select_profile(game_dir)
+        if profile is None:
+            return
+
+        # Same profile as last time: sync only what changed
+        if game.get("manifest") and profile == game.get("profile"):
+            if questionary.confirm(
+                f"Reinstall BepInEx for {game_name}?", default=True, style=questionary_style
+            ).ask():
+                if self.sync_recent_game(game):
+                    console.print("\n[success]✅ Installation successful![/success]")
+                else:
+                    console.print("\n[error]❌ Installation failed.[/error]")
+            return
+
         # Find BepInEx folder
         console.print("\n[info]Searching for BepInEx folder...[/info]")
-        bepinex_path = self.find_bepinex_folder(game_dir)
+        bepinex_path = self.find_bepinex_folder(game_dir, profile)
 
         if not bepinex_path:
             console.print(
@@ -1039,32 +5213,354 @@ class ThunderModInstaller:
 
             if success:
                 # Update recent games (move to top)
-                self._add_recent_game(game_name, game_dir, exe_path)
+                self._add_recent_game(
+                    game_name, game_dir, exe_path, bepinex_path, profile
+                )
                 console.print("\n[success]✅ Installation successful![/success]")
             else:
                 console.print("\n[error]❌ Installation failed.[/error]")
 
 
+# Local service endpoint used by --serve and by main() to forward requests
+SERVICE_HOST = "127.0.0.1"
+SERVICE_PORT = 47615
+SERVICE_SOCKET = os.path.join(os.path.expanduser("~"), ".thundermod_service.sock")
+# Per-user secret a running service expects in every request
+SERVICE_TOKEN_FILE = os.path.join(os.path.expanduser("~"), ".thundermod_service.token")
+SERVICE_MAX_REQUEST = 64 * 1024
+
+
+def _service_uses_unix_socket() -> bool:
+    return platform.system() != "Windows" and hasattr(socket, "AF_UNIX")
+
+
+def _read_service_token() -> Optional[str]:
+    try:
+        with open(SERVICE_TOKEN_FILE, "r") as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
+
+
+def service_request(
+    payload: Dict[str, Any], timeout: Optional[float] = 2.0
+) -> Optional[Dict[str, Any]]:
+    """
+    Send one JSON request to a running service and return its reply.
+    Returns None if no service is listening.
+    """
+    # Without the service's token there is nothing to talk to
+    token = _read_service_token()
+    if token is None:
+        return None
+
+    try:
+        if _service_uses_unix_socket():
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(timeout)
+            sock.connect(SERVICE_SOCKET)
+        else:
+            sock = socket.create_connection((SERVICE_HOST, SERVICE_PORT), timeout)
+    except OSError:
+        return None
+
+    try:
+        # Installs can take a while; only the connect is time-limited
+        sock.settimeout(None)
+        with sock, sock.makefile("rwb") as stream:
+            stream.write(json.dumps({**payload, "token": token}).encode("utf-8") + b"\n")
+            stream.flush()
+            line = stream.readline()
+        return json.loads(line) if line else None
+    except (OSError, ValueError) as e:
+        Logger.error(f"Error talking to service: {e}")
+        return None
+
+
+class InstallerService:
+    """
+    Long-running service that keeps the Thunderstore index, fuzzy matcher and
+    hash manifests warm, answering one JSON object per line on a local socket.
+
+    Requests: {"op": "status"}, {"op": "install", "game": ..., "exe_path": ...},
+    {"op": "verify", "game": ..., "exe_path": ...} and {"op": "stop"}; install
+    and verify accept an optional "profile". Every request carries the
+    "token" the service writes to SERVICE_TOKEN_FILE, readable only by the
+    user who started it; a connection is closed on its first bad request.
+    """
+
+    def __init__(self, installer: ThunderModInstaller):
+        self.installer = installer
+        self.installer.interactive = False
+        self.started = time.time()
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._server = None
+        self.token = secrets.token_hex(32)
+
+    def _resolve(self, request: Dict[str, Any]) -> Tuple[str, str]:
+        """Resolve a request's game name to (game_dir, bepinex_source)."""
+        game = request.get("game")
+        if not game:
+            raise ValueError("Missing 'game'")
+        if not self.installer.thunderstore_path:
+            raise ValueError("Thunderstore Mod Manager not found")
+
+        matches = [
+            path for path, score in self.installer.find_game_directory(game) if score > 0.3
+        ]
+        if not matches:
+            raise ValueError(f"No games found matching '{game}'")
+
+        bepinex_path = self.installer.find_bepinex_folder(
+            matches[0], request.get("profile")
+        )
+        if not bepinex_path:
+            raise ValueError("BepInEx folder not found for the selected game")
+        return matches[0], bepinex_path
+
+    def handle(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Process one decoded request and return the reply object."""
+        op = request.get("op")
+        self.requests += 1
+
+        if op == "status":
+            return {
+                "ok": True,
+                "pid": os.getpid(),
+                "uptime": round(time.time() - self.started, 1),
+                "requests": self.requests,
+                "thunderstore_path": self.installer.thunderstore_path,
+                "games": len(self.installer._game_index),
+                "hashed_files": len(self.installer._hash_cache),
+            }
+
+        if op == "stop":
+            threading.Thread(target=self._server.shutdown, daemon=True).start()
+            return {"ok": True}
+
+        if op not in ("install", "verify"):
+            return {"ok": False, "error": f"Unknown op: {op}"}
+
+        exe_path = request.get("exe_path")
+        if not exe_path or not os.path.exists(exe_path):
+            return {"ok": False, "error": f"Game executable not found: {exe_path}"}
+
+        # One install or verify at a time; status stays responsive
+        with self._lock:
+            try:
+                game_dir, bepinex_path = self._resolve(request)
+            except (ValueError, OSError) as e:
+                return {"ok": False, "error": str(e)}
+
+            game_name = os.path.basename(game_dir)
+            if op == "install":
+                success = self.installer.install_bepinex(
+                    bepinex_path, exe_path, game_name
+                )
+                return dict(self.installer.last_result, ok=success)
+
+            result = self.installer.verify_install(
+                bepinex_path, os.path.dirname(exe_path)
+            )
+            result.update(game=game_name, bepinex_source=bepinex_path)
+            return result
+
+    def serve_forever(self):
+        """Listen on the local socket until stopped."""
+        service = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def reply(self, reply):
+                self.wfile.write(json.dumps(reply).encode("utf-8") + b"\n")
+                self.wfile.flush()
+
+            def handle(self):
+                while True:
+                    line = self.rfile.readline(SERVICE_MAX_REQUEST)
+                    if not line:
+                        return
+                    # Stop reading from a peer on its first bad request
+                    try:
+                        if len(line) >= SERVICE_MAX_REQUEST and not line.endswith(b"\n"):
+                            raise ValueError("request too long")
+                        request = json.loads(line)
+                        if not isinstance(request, dict):
+                            raise ValueError("expected a JSON object")
+                    except ValueError as e:
+                        self.reply({"ok": False, "error": f"Bad request: {e}"})
+                        return
+                    token = str(request.pop("token", "")).encode("utf-8")
+                    if not hmac.compare_digest(token, service.token.encode("utf-8")):
+                        Logger.error("Service request rejected: bad token")
+                        self.reply({"ok": False, "error": "Not authorized"})
+                        return
+
+                    try:
+                        reply = service.handle(request)
+                    except Exception as e:
+                        Logger.error(f"Service error: {e}")
+                        reply = {"ok": False, "error": str(e)}
+                    self.reply(reply)
+
+        if _service_uses_unix_socket():
+            if os.path.exists(SERVICE_SOCKET):
+                os.unlink(SERVICE_SOCKET)  # stale socket, a live one answered status
+            self._server = socketserver.ThreadingUnixStreamServer(SERVICE_SOCKET, Handler)
+            os.chmod(SERVICE_SOCKET, 0o600)
+            address = SERVICE_SOCKET
+        else:
+            self._server = socketserver.ThreadingTCPServer(
+                (SERVICE_HOST, SERVICE_PORT), Handler
+            )
+            address = f"{SERVICE_HOST}:{SERVICE_PORT}"
+        self._write_token()
+
+        # Warm the game index and profile catalogue before the first request
+        if self.installer.thunderstore_path:
+            self.installer.list_game_directories()
+            self.installer.refresh_profile_catalogue()
+
+        console.print(f"[info]ThunderMod service listening on {address}[/info]")
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+            if _read_service_token() == self.token:
+                os.unlink(SERVICE_TOKEN_FILE)
+            if _service_uses_unix_socket() and os.path.exists(SERVICE_SOCKET):
+                os.unlink(SERVICE_SOCKET)
+
+    def _write_token(self):
+        """Publish the token in a file only the current user can read."""
+        partial = SERVICE_TOKEN_FILE + ".tmp"
+        if os.path.lexists(partial):
+            os.unlink(partial)
+        fd = os.open(partial, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, "w") as f:
+            f.write(self.token)
+        os.replace(partial, SERVICE_TOKEN_FILE)
+
+
 def main():
     """Main entry point for the ThunderMod Installer."""
+    global output_mode
+
     parser = argparse.ArgumentParser(
         description="Install BepInEx for games from Thunderstore Mod Manager"
     )
+    parser.add_argument(
+        "command",
+        nargs="?",
+        choices=[
+            "plugins",
+            "gc-store",
+            "uninstall",
+            "export-pack",
+            "import-pack",
+            "restore",
+            "reinstall-recent",
+        ],
+        help="plugins: query the installed plugin index; "
+        "gc-store: remove unused blobs from the deduplicated store; "
+        "uninstall: remove BepInEx from the game at --exe-path; "
+        "export-pack: write --game's BepInEx profile to --pack; "
+        "import-pack: install --pack into the game at --exe-path; "
+        "restore: restore a backup snapshot into the game at --exe-path; "
+        "reinstall-recent: sync every recent game with its Thunderstore profile",
+    )
     parser.add_argument("--game", type=str, help="Game name to search for")
     parser.add_argument(
         "--thunderstore-path",
         type=str,
         help="Custom path to Thunderstore Mod Manager DataFolder",
     )
-    parser.add_argument("--exe-path", type=str, help="Path to game executable")
+    parser.add_argument(
+        "--exe-path",
+        type=str,
+        help="Path to game executable (found in the game library folders if omitted)",
+    )
+    parser.add_argument(
+        "--profile", type=str, help="Thunderstore profile to install from"
+    )
     parser.add_argument("--debug", action="store_true", help="Enable debug logging")
     parser.add_argument("--quiet", action="store_true", help="Minimal output")
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print progress events and a final result as JSON lines",
+    )
     parser.add_argument(
         "--no-backup",
         action="store_true",
         help="Skip backup of existing BepInEx folder",
     )
     parser.add_argument("--version", action="store_true", help="Show version and exit")
+    parser.add_argument(
+        "--throttle",
+        type=float,
+        metavar="MBPS",
+        help="Limit copy throughput to this many MB/s",
+    )
+    parser.add_argument(
+        "--low-priority",
+        action="store_true",
+        help="Run at low CPU and I/O priority so other apps stay responsive",
+    )
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="Run as a background service answering requests on a local socket",
+    )
+    parser.add_argument(
+        "--pack",
+        type=str,
+        help="Pack archive path (.zip, .tar.gz/.tgz, .tar.bz2 or .tar.xz)",
+    )
+    parser.add_argument(
+        "--snapshot",
+        type=str,
+        help="restore: snapshot file name (defaults to the newest)",
+    )
+    parser.add_argument(
+        "--plugin", type=str, help="plugins: plugin name (or Author-Name) to look up"
+    )
+    parser.add_argument(
+        "--plugin-version", type=str, help="plugins: only match this version"
+    )
+    parser.add_argument(
+        "--largest",
+        type=int,
+        metavar="N",
+        help="plugins: list the N largest plugins",
+    )
+    parser.add_argument(
+        "--benchmark",
+        type=str,
+        metavar="SOURCE",
+        help="Benchmark copy strategies by copying a BepInEx folder to a scratch directory",
+    )
+    parser.add_argument(
+        "--benchmark-workers",
+        type=str,
+        metavar="N,N,...",
+        help="Worker counts to compare in the benchmark (default 1,2,4,8)",
+    )
+    parser.add_argument(
+        "--benchmark-dir",
+        type=str,
+        help="Directory for benchmark scratch copies (defaults to the system temp dir)",
+    )
+    parser.add_argument(
+        "--simulate-fs",
+        choices=sorted(SimulatedFS.PROFILES),
+        help="Run copy, search and backup I/O through a simulated disk with its latency and throughput",
+    )
+    parser.add_argument(
+        "--no-service",
+        action="store_true",
+        help="Do not forward to a running service",
+    )
 
     args = parser.parse_args()
 
@@ -1073,8 +5569,84 @@ def main():
         console.print("[title]ThunderMod Installer[/title] v1.0.0")
         return 0
 
+    if not args.json:
+        if args.quiet:
+            output_mode = "plain"
+        return run_cli(args, {})
+
+    # Rich output is silenced; events, errors and the result go to stdout
+    output_mode = "json"
+    console.quiet = True
+    errors = _JsonErrorHandler()
+    Logger.addHandler(errors)
+    result: Dict[str, Any] = {"command": args.command or "install"}
+    started = time.perf_counter()
+    try:
+        code = run_cli(args, result)
+    except Exception as e:
+        Logger.error(f"Unexpected error: {e}")
+        code = 1
+    finally:
+        Logger.removeHandler(errors)
+
+    result.update(
+        ok=code == 0,
+        exit_code=code,
+        duration=round(time.perf_counter() - started, 3),
+        errors=errors.errors,
+    )
+    emit_json({"event": "result", "time": round(time.time(), 3), **result})
+    return code
+
+
+def run_cli(args: argparse.Namespace, result: Dict[str, Any]) -> int:
+    """Run the command selected by the parsed arguments; fills in result."""
+    if args.serve:
+        if service_request({"op": "status"}):
+            console.print("[error]A ThunderMod service is already running.[/error]")
+            return 1
+    elif (
+        args.command is None
+        and not args.benchmark
+        and args.game
+        and args.exe_path
+        and not args.no_service
+        and not args.no_backup
+        and args.throttle is None
+        and not args.thunderstore_path
+        and not args.simulate_fs
+        and not args.low_priority
+        and not args.json
+    ):
+        # Forward plain installs to a warm service if one is running; the
+        # service neither lowers its priority nor streams events, so runs
+        # asking for either stay local
+        reply = service_request(
+            {
+                "op": "install",
+                "game": args.game,
+                "exe_path": args.exe_path,
+                "profile": args.profile,
+            },
+            timeout=0.5,
+        )
+        if reply is not None:
+            result.update(reply, via="service")
+            if reply.get("ok"):
+                console.print(
+                    f"[success]BepInEx installed for {reply.get('game')} by the running service.[/success]"
+                )
+                return 0
+            console.print(f"[error]Service error: {reply.get('error', 'Installation failed')}[/error]")
+            return 1
+
     # Create installer
-    installer = ThunderModInstaller(debug=args.debug)
+    installer = ThunderModInstaller(
+        debug=args.debug,
+        fs=SimulatedFS.from_profile(args.simulate_fs) if args.simulate_fs else None,
+    )
+    # JSON output is read by other programs: never stop to ask anything
+    installer.interactive = output_mode != "json"
 
     # Override Thunderstore path if specified
     if args.thunderstore_path:
@@ -1097,15 +5669,130 @@ def main():
     if args.no_backup:
         installer.config["auto_backup"] = False
 
+    if args.throttle is not None:
+        installer.config["throttle_mbps"] = args.throttle
+
+    # Lower priority before any worker threads are started
+    if args.low_priority or installer.config.get("low_priority", False):
+        set_low_priority()
+
+    if args.command == "plugins":
+        if not installer.thunderstore_path:
+            console.print("[error]Thunderstore Mod Manager not found![/error]")
+            return 1
+        if args.plugin:
+            installer.display_plugins(
+                installer.find_plugins(args.plugin, args.plugin_version),
+                f"Plugin: {args.plugin}",
+            )
+        else:
+            installer.display_plugins(
+                installer.largest_plugins(args.largest or 10), "Largest plugins"
+            )
+        return 0
+
+    if args.command == "uninstall":
+        if not args.exe_path or not os.path.exists(args.exe_path):
+            console.print(f"[error]Game executable not found: {args.exe_path}[/error]")
+            return 1
+        return 0 if installer.uninstall_bepinex(args.exe_path) else 1
+
+    if args.command == "restore":
+        if not args.exe_path or not os.path.exists(args.exe_path):
+            console.print(f"[error]Game executable not found: {args.exe_path}[/error]")
+            return 1
+        return 0 if installer.restore_snapshot(args.exe_path, args.snapshot) else 1
+
+    if args.command == "reinstall-recent":
+        if not installer.recent_games:
+            console.print("[info]No recent games found.[/info]")
+            return 0
+        results = installer.reinstall_recent_games()
+        result["games"] = results
+        return 0 if all(r.get("ok") for r in results) else 1
+
+    if args.command == "import-pack":
+        if not args.pack or not os.path.isfile(args.pack):
+            console.print(f"[error]Pack not found: {args.pack}[/error]")
+            return 1
+        if not args.exe_path or not os.path.exists(args.exe_path):
+            console.print(f"[error]Game executable not found: {args.exe_path}[/error]")
+            return 1
+        return 0 if installer.import_pack(args.pack, args.exe_path) else 1
+
+    if args.command == "export-pack":
+        if not args.game or not args.pack:
+            console.print("[error]export-pack needs --game and --pack.[/error]")
+            return 1
+        if not installer.thunderstore_path:
+            console.print("[error]Thunderstore Mod Manager not found![/error]")
+            return 1
+        valid_matches = [
+            path for path, score in installer.find_game_directory(args.game) if score > 0.3
+        ]
+        if not valid_matches:
+            console.print(f"[error]No games found matching '{args.game}'.[/error]")
+            return 1
+        bepinex_path = installer.find_bepinex_folder(valid_matches[0], args.profile)
+        if not bepinex_path:
+            console.print("[error]BepInEx folder not found for the selected game.[/error]")
+            return 1
+        game_name = os.path.basename(valid_matches[0])
+        return 0 if installer.export_pack(bepinex_path, args.pack, game_name) else 1
+
+    if args.command == "gc-store":
+        # Collect the stores serving every known game directory
+        game_dirs = [os.path.dirname(g.get("exe", "")) for g in installer.recent_games]
+        if args.exe_path:
+            game_dirs.append(os.path.dirname(os.path.abspath(args.exe_path)))
+
+        roots = set()
+        for game_dir in game_dirs:
+            store = installer._store_for(game_dir) if os.path.isdir(game_dir) else None
+            if store is None or store.root in roots or not os.path.isdir(store.root):
+                continue
+            roots.add(store.root)
+            removed, freed = store.gc()
+            console.print(
+                f"[success]{store.root}: removed {removed} blobs, freed {freed / (1024 * 1024):.1f} MB[/success]"
+            )
+        if not roots:
+            console.print("[info]No deduplicated stores found.[/info]")
+        return 0
+
+    if args.benchmark:
+        if not os.path.isdir(args.benchmark):
+            console.print(f"[error]Benchmark source not found: {args.benchmark}[/error]")
+            return 1
+        worker_counts = None
+        if args.benchmark_workers:
+            try:
+                worker_counts = [
+                    int(n) for n in args.benchmark_workers.split(",") if n.strip()
+                ]
+            except ValueError:
+                console.print("[error]--benchmark-workers takes numbers like 1,2,4,8[/error]")
+                return 1
+        installer.benchmark_copy(args.benchmark, args.benchmark_dir, worker_counts)
+        return 0
+
+    if args.serve:
+        try:
+            InstallerService(installer).serve_forever()
+        except KeyboardInterrupt:
+            console.print("\n[info]Service stopped.[/info]")
+        return 0
+
     # If arguments are provided, use them
-    if args.game and args.exe_path:
+    if args.game:
         # Non-interactive mode with arguments
         if not installer.thunderstore_path:
             Logger.error("Thunderstore Mod Manager not found!")
             console.print("[error]Thunderstore Mod Manager not found![/error]")
             return 1
 
-        with yaspin(Spinners.dots, text=f"Searching for game '{args.game}'...") as sp:
+        resolve_started = time.perf_counter()
+        with spinner(Spinners.dots, f"Searching for game '{args.game}'...") as sp:
             game_matches = installer.find_game_directory(args.game)
             valid_matches = [
                 (path, score) for path, score in game_matches if score > 0.3
@@ -1122,8 +5809,10 @@ def main():
         selected_game_dir = valid_matches[0][0]
         game_name = os.path.basename(selected_game_dir)
 
-        with yaspin(Spinners.dots, text="Searching for BepInEx folder...") as sp:
-            bepinex_path = installer.find_bepinex_folder(selected_game_dir)
+        with spinner(Spinners.dots, "Searching for BepInEx folder...") as sp:
+            bepinex_path = installer.find_bepinex_folder(
+                selected_game_dir, args.profile
+            )
 
             if not bepinex_path:
                 sp.fail("✗")
@@ -1135,15 +5824,47 @@ def main():
 
             sp.ok("✓")
 
-        if not os.path.exists(args.exe_path):
-            Logger.error(f"Game executable not found: {args.exe_path}")
-            console.print(f"[error]Game executable not found: {args.exe_path}[/error]")
+        exe_path = args.exe_path
+        if not exe_path:
+            with spinner(Spinners.dots, "Looking for the game executable...") as sp:
+                exe_path = installer.find_game_executable(game_name)
+                if not exe_path:
+                    sp.fail("✗")
+                    Logger.error(f"Game executable not found for {game_name}.")
+                    console.print(
+                        f"[error]Could not find the executable for {game_name}. Pass "
+                        "--exe-path or add its library folder to game_library_roots.[/error]"
+                    )
+                    return 1
+                sp.ok("✓")
+            console.print(f"Found game executable: [path]{exe_path}[/path]")
+
+        if not os.path.exists(exe_path):
+            Logger.error(f"Game executable not found: {exe_path}")
+            console.print(f"[error]Game executable not found: {exe_path}[/error]")
             return 1
 
-        success = installer.install_bepinex(bepinex_path, args.exe_path, game_name)
+        resolve_duration = round(time.perf_counter() - resolve_started, 3)
+        success = installer.install_bepinex(bepinex_path, exe_path, game_name)
+        # The result only names the backup once its snapshot is written
+        installer.wait_for_backups()
+        result.update(installer.last_result)
+        result["phases"] = {"resolve": resolve_duration, **result.get("phases", {})}
+        if success:
+            installer._add_recent_game(
+                game_name,
+                selected_game_dir,
+                exe_path,
+                bepinex_path,
+                installer.profile_name(selected_game_dir, bepinex_path),
+            )
         return 0 if success else 1
 
     else:
+        if output_mode == "json":
+            Logger.error("--json needs --game or a command")
+            return 1
+
         # Interactive mode
         try:
             success = installer.run()
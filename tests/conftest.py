@@ -0,0 +1,76 @@
+import importlib.util
+import os
+import sys
+import threading
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture(scope="session")
+def thx():
+    """The installer script, loaded as a module (its file name has a dot)."""
+    spec = importlib.util.spec_from_file_location(
+        "thunderinex", os.path.join(ROOT, "ThunderinexV1.1.py")
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["thunderinex"] = module
+    spec.loader.exec_module(module)
+    module.output_mode = "plain"
+    return module
+
+
+@pytest.fixture
+def home(tmp_path, monkeypatch):
+    path = tmp_path / "home"
+    path.mkdir()
+    monkeypatch.setenv("HOME", str(path))
+    monkeypatch.setenv("USERPROFILE", str(path))
+    return path
+
+
+@pytest.fixture
+def make_installer(thx, home):
+    def make(fs=None):
+        installer = thx.ThunderModInstaller(fs=fs)
+        installer.interactive = False
+        return installer
+
+    return make
+
+
+@pytest.fixture
+def game(tmp_path):
+    """A profile's BepInEx folder with a doorstop file, and an empty game folder."""
+    source = tmp_path / "profile" / "BepInEx"
+    for rel_path in ("core/BepInEx.dll", "plugins/Author-Mod/Mod.dll", "config/BepInEx.cfg"):
+        path = source / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(rel_path.encode() * 100)
+    (source.parent / "winhttp.dll").write_bytes(b"doorstop")
+
+    game_dir = tmp_path / "game"
+    game_dir.mkdir()
+    exe = game_dir / "Game.exe"
+    exe.write_bytes(b"exe")
+    return {"source": str(source), "dir": game_dir, "exe": str(exe)}
+
+
+def wait_for_background(installer=None):
+    """Let background deletions and snapshots finish."""
+    if installer is not None:
+        installer.wait_for_backups()
+    for thread in threading.enumerate():
+        if thread.name == "thunderinex-delete":
+            thread.join()
+
+
+def tree(root):
+    """Relative paths of the files under root, skipping Thunderinex bookkeeping."""
+    return sorted(
+        os.path.relpath(os.path.join(dirpath, name), root).replace(os.sep, "/")
+        for dirpath, dirnames, names in os.walk(root)
+        for name in names
+        if ".thunderinex_" not in dirpath
+    )
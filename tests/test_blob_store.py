@@ -0,0 +1,39 @@
+import os
+
+
+def test_store_sits_in_the_steam_library(thx, tmp_path):
+    game_dir = tmp_path / "Library" / "steamapps" / "common" / "Game"
+    game_dir.mkdir(parents=True)
+
+    store = thx.BlobStore.for_path(str(game_dir), fallback_dir=str(tmp_path / "cache"))
+
+    assert store.root == str(tmp_path / "Library" / thx.BlobStore.DIR_NAME)
+
+
+def test_store_falls_back_to_the_cache_or_configured_folder(thx, tmp_path):
+    game_dir = tmp_path / "Games" / "Game"
+    game_dir.mkdir(parents=True)
+
+    store = thx.BlobStore.for_path(str(game_dir), fallback_dir=str(tmp_path / "cache"))
+    assert store.root == str(tmp_path / "cache" / "store")
+
+    store = thx.BlobStore.for_path(str(game_dir), str(tmp_path / "blobs"), str(tmp_path / "cache"))
+    assert store.root == str(tmp_path / "blobs")
+
+    assert thx.BlobStore.for_path(str(game_dir)) is None
+
+
+def test_store_patterns_match_the_path_inside_bepinex(make_installer, game, tmp_path):
+    installer = make_installer()
+    installer.config.update(
+        dedup_store=True,
+        dedup_patterns=["plugins/*"],
+        dedup_store_dir=str(tmp_path / "blobs"),
+    )
+    assert installer.install_bepinex(game["source"], game["exe"], "Game")
+    installer.wait_for_backups()
+
+    bepinex = game["dir"] / "BepInEx"
+    assert os.stat(bepinex / "plugins" / "Author-Mod" / "Mod.dll").st_nlink == 2
+    assert os.stat(bepinex / "core" / "BepInEx.dll").st_nlink == 1
+
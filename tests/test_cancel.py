@@ -0,0 +1,26 @@
+import shutil
+
+
+def test_cancelled_verify_reports_instead_of_hashing(thx, make_installer, game):
+    installer = make_installer()
+    installer.cancel_token = thx.CancelToken()
+    installer.cancel_token.cancel("Stopped")
+
+    result = installer.verify_install(game["source"], str(game["dir"]))
+
+    assert result == {"ok": False, "cancelled": True, "error": "Stopped"}
+
+
+def test_cancelled_plugin_index_keeps_previous_index(thx, make_installer, game, tmp_path):
+    profile = tmp_path / "thunderstore" / "Game" / "profiles" / "Default"
+    shutil.copytree(game["source"], str(profile / "BepInEx"))
+    installer = make_installer()
+    installer.thunderstore_path = str(tmp_path / "thunderstore")
+    first = installer.build_plugin_index()
+    assert [record["folder"] for record in first.values()] == ["Author-Mod"]
+
+    (profile / "BepInEx" / "plugins" / "Other-Mod").mkdir()
+    installer.cancel_token = thx.CancelToken()
+    installer.cancel_token.cancel()
+
+    assert installer.build_plugin_index() == first
@@ -0,0 +1,47 @@
+import errno
+import os
+
+from conftest import tree, wait_for_background
+
+
+def contents(root):
+    return {path: (root / path).read_bytes() for path in tree(str(root))}
+
+
+def install_then_change_source(make_installer, game):
+    """Install once for real, then change the source so a reinstall differs."""
+    installer = make_installer()
+    assert installer.install_bepinex(game["source"], game["exe"], "Game")
+    wait_for_background(installer)
+    source = os.path.dirname(game["source"])
+    for rel_path in ("BepInEx/core/BepInEx.dll", "BepInEx/plugins/Author-Mod/Mod.dll", "winhttp.dll"):
+        with open(os.path.join(source, rel_path), "ab") as f:
+            f.write(b"new version")
+    return contents(game["dir"])
+
+
+def test_disk_full_partway_restores_previous_install(thx, make_installer, game):
+    before = install_then_change_source(make_installer, game)
+    fs = thx.SimulatedFS(capacity=3000)
+    installer = make_installer(fs)
+    installer.config["copy_workers"] = 1
+
+    assert not installer.install_bepinex(game["source"], game["exe"], "Game")
+    wait_for_background(installer)
+
+    assert fs.written > 0  # Some files were copied before the disk filled up
+    assert contents(game["dir"]) == before
+
+
+def test_locked_doorstop_restores_previous_install(thx, make_installer, game):
+    before = install_then_change_source(make_installer, game)
+    fs = thx.SimulatedFS()
+    fs.lock("*/game/winhttp.dll")
+    installer = make_installer(fs)
+
+    assert not installer.install_bepinex(game["source"], game["exe"], "Game")
+    wait_for_background(installer)
+
+    assert fs.calls["replace"] > 0
+    assert contents(game["dir"]) == before
+    assert not [name for name in os.listdir(str(game["dir"])) if name.endswith(".thunderinex-part")]
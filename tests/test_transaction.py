@@ -0,0 +1,36 @@
+import os
+
+from conftest import tree, wait_for_background
+
+
+def test_failed_import_restores_previous_install(thx, make_installer, game, tmp_path):
+    installer = make_installer()
+    pack = str(tmp_path / "game.zip")
+    assert installer.export_pack(game["source"], pack, "Game")
+    with open(os.path.join(game["source"], "core", "BepInEx.dll"), "ab") as f:
+        f.write(b"new version")
+    with open(os.path.join(os.path.dirname(game["source"]), "winhttp.dll"), "ab") as f:
+        f.write(b"new version")
+    assert installer.install_bepinex(game["source"], game["exe"], "Game")
+    wait_for_background(installer)
+    before = {path: (game["dir"] / path).read_bytes() for path in tree(str(game["dir"]))}
+
+    fs = thx.SimulatedFS()
+    fs.lock("*/game/winhttp.dll")
+    assert not make_installer(fs).import_pack(pack, game["exe"])
+
+    after = {path: (game["dir"] / path).read_bytes() for path in tree(str(game["dir"]))}
+    assert after == before
+
+
+def test_list_snapshots_skips_entries_pruned_meanwhile(thx, make_installer, tmp_path):
+    backup_dir = tmp_path / ".thunderinex_backups"
+    backup_dir.mkdir()
+    (backup_dir / "BepInEx_2.zip").write_bytes(b"")
+    fs = thx.RealFS()
+    # BepInEx_1.zip is pruned between the listing and its stat
+    fs.listdir = lambda path: ["BepInEx_1.zip", "BepInEx_2.zip"]
+
+    snapshots = make_installer(fs).list_snapshots(str(tmp_path))
+
+    assert snapshots == [str(backup_dir / "BepInEx_2.zip")]
@@ -0,0 +1,34 @@
+import subprocess
+import sys
+import time
+
+from conftest import wait_for_background
+
+
+def test_sweep_leaves_other_running_instances_alone(make_installer, game):
+    installer = make_installer()
+    assert installer.install_bepinex(game["source"], game["exe"], "Game")
+    wait_for_background(installer)
+
+    other = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+    finished = subprocess.Popen([sys.executable, "-c", "pass"])
+    finished.wait()
+    try:
+        trash = game["dir"] / ".thunderinex_trash"
+        trash.mkdir()
+        live = trash / f"BepInEx_{other.pid}_{time.time_ns()}"
+        (live / "core").mkdir(parents=True)
+        (live / "core" / "BepInEx.dll").write_bytes(b"previous install")
+        dead = trash / f"BepInEx_{finished.pid}_{time.time_ns()}"
+        dead.mkdir()
+        legacy = trash / f"BepInEx_{time.time_ns()}"
+        legacy.mkdir()
+
+        assert installer.uninstall_bepinex(game["exe"])
+        wait_for_background(installer)
+
+        assert [path.name for path in trash.iterdir()] == [live.name]
+        assert (live / "core" / "BepInEx.dll").read_bytes() == b"previous install"
+    finally:
+        other.kill()
+        other.wait()
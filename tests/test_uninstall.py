@@ -0,0 +1,32 @@
+import errno
+import os
+
+from conftest import tree, wait_for_background
+
+
+def test_uninstall_removes_install_and_keeps_user_files(make_installer, game):
+    installer = make_installer()
+    assert installer.install_bepinex(game["source"], game["exe"], "Game")
+    wait_for_background(installer)
+    (game["dir"] / "BepInEx" / "config" / "mine.cfg").write_text("user")
+
+    assert installer.uninstall_bepinex(game["exe"])
+    wait_for_background(installer)
+
+    assert tree(game["dir"]) == ["BepInEx/config/mine.cfg", "Game.exe"]
+    assert not (game["dir"] / ".thunderinex_trash").exists()
+
+
+def test_failed_uninstall_puts_everything_back(thx, make_installer, game):
+    assert make_installer().install_bepinex(game["source"], game["exe"], "Game")
+    (game["dir"] / "BepInEx" / "config" / "mine.cfg").write_text("user")
+    before = tree(game["dir"])
+
+    fs = thx.SimulatedFS()
+    fs.fail("unlink", "*/.thunderinex_manifest.json", errno.EACCES)
+    installer = make_installer(fs=fs)
+    assert not installer.uninstall_bepinex(game["exe"])
+    wait_for_background(installer)
+
+    assert tree(game["dir"]) == before
+    assert os.listdir(game["dir"] / ".thunderinex_trash") == []